@@ -53,6 +53,8 @@ def mk_ffi(
     :param name: The name of the FFI object.
     :return: An FFI object.
     """
+    # Functions compiled in API mode release the GIL for the duration of every call into
+    # libsecp256k1, so signing, verification, ECDH, etc. already scale across threads
     _ffi = FFI()
     code = [define_static_lib] if static_lib else []
 
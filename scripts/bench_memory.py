@@ -0,0 +1,46 @@
+# /// script
+# dependencies = [
+#   "coincurve",
+# ]
+# [tool.uv.sources]
+# coincurve = { path = ".." }
+# ///
+import sys
+import tracemalloc
+from decimal import Decimal
+
+from coincurve import PrivateKey, PublicKey, PublicKeyXOnly
+
+OBJECTS = 100_000
+# The size of the opaque `secp256k1_pubkey` and `secp256k1_xonly_pubkey` structures
+PUBKEY_STRUCT_SIZE = 64
+
+
+def measure(factory, inputs: list) -> Decimal:
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [factory(data) for data in inputs]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Exclude the list holding the objects
+    used = end - start - sys.getsizeof(objects)
+    return (Decimal(used) / len(objects)).quantize(Decimal("0.1"))
+
+
+def main():
+    print(sys.version)
+    private_keys = [PrivateKey() for _ in range(OBJECTS)]
+    secrets = [private_key.secret for private_key in private_keys]
+    public_keys = [private_key.public_key.format() for private_key in private_keys]
+    xonly_public_keys = [private_key.public_key_xonly.format() for private_key in private_keys]
+
+    # Memory allocated by CFFI is not visible to tracemalloc so the struct sizes are reported separately
+    print("Bytes per object (Python allocations):")
+    print(f"  PrivateKey: {measure(PrivateKey, secrets)}")
+    print(f"  PublicKey: {measure(PublicKey, public_keys)} + {PUBKEY_STRUCT_SIZE}")
+    print(f"  PublicKeyXOnly: {measure(PublicKeyXOnly, xonly_public_keys)} + {PUBKEY_STRUCT_SIZE}")
+
+
+if __name__ == "__main__":
+    main()
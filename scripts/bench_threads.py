@@ -0,0 +1,55 @@
+# /// script
+# dependencies = [
+#   "coincurve",
+# ]
+# [tool.uv.sources]
+# coincurve = { path = ".." }
+# ///
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from coincurve import PrivateKey
+
+OPERATIONS = 20_000
+PRIVATE_KEY = PrivateKey()
+PUBLIC_KEY = PRIVATE_KEY.public_key
+MSG_HASH = os.urandom(32)
+SIGNATURE = PRIVATE_KEY.sign(MSG_HASH, hasher=None)
+
+
+def sign(operations: int) -> None:
+    for _ in range(operations):
+        PRIVATE_KEY.sign(MSG_HASH, hasher=None)
+
+
+def verify(operations: int) -> None:
+    for _ in range(operations):
+        PUBLIC_KEY.verify(SIGNATURE, MSG_HASH, hasher=None)
+
+
+def measure(func, threads: int) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = perf_counter()
+        list(executor.map(func, [OPERATIONS // threads] * threads))
+        return perf_counter() - start
+
+
+def main():
+    print(sys.version)
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil_enabled}")
+
+    max_threads = os.cpu_count() or 1
+    thread_counts = sorted({2**i for i in range(max_threads.bit_length())} | {max_threads})
+    for func in (sign, verify):
+        baseline = measure(func, 1)
+        print(f"{func.__name__} ({OPERATIONS} operations):")
+        for threads in thread_counts:
+            elapsed = baseline if threads == 1 else measure(func, threads)
+            print(f"  {threads} thread(s): {elapsed:.3f}s, {baseline / elapsed:.2f}x speedup")
+
+
+if __name__ == "__main__":
+    main()
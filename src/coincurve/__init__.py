@@ -1,13 +1,29 @@
-from coincurve.context import GLOBAL_CONTEXT, Context
-from coincurve.keys import PrivateKey, PublicKey, PublicKeyXOnly
-from coincurve.utils import verify_signature
+from coincurve.cache import PublicKeyCache, SignatureCache
+from coincurve.context import GLOBAL_CONTEXT, Context, ContextPool
+from coincurve.keys import (
+    EcdsaSignature,
+    PrivateKey,
+    PublicKey,
+    PublicKeyArray,
+    PublicKeyXOnly,
+    RecoverableSignature,
+)
+from coincurve.utils import generate_keys, verify_batch, verify_signature
 
 __version__ = "22.0.0"
 __all__ = [
     "GLOBAL_CONTEXT",
     "Context",
+    "ContextPool",
+    "EcdsaSignature",
     "PrivateKey",
     "PublicKey",
+    "PublicKeyArray",
+    "PublicKeyCache",
     "PublicKeyXOnly",
+    "RecoverableSignature",
+    "SignatureCache",
+    "generate_keys",
+    "verify_batch",
     "verify_signature",
 ]
@@ -0,0 +1,260 @@
+"""
+Signing and verification for asyncio applications.
+
+Individual requests are collected into micro-batches which are processed by an executor, keeping the event loop
+responsive. A batch is dispatched as soon as it is full or once the oldest request in it has waited for the
+configured latency cap. Since calls into libsecp256k1 release the GIL, the default thread pool executor processes
+concurrent batches in parallel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING
+
+from coincurve.context import GLOBAL_CONTEXT, Context
+from coincurve.utils import MSG_HASH_SIZE, sha256, verify_batch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Executor
+
+    from coincurve.keys import PrivateKey
+    from coincurve.types import Hasher
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_LATENCY = 0.001
+
+
+def _resolve(futures: list[asyncio.Future], task: asyncio.Future) -> None:
+    if task.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+
+    exception = task.exception()
+    if exception is not None:
+        for future in futures:
+            if not future.done():
+                future.set_exception(exception)
+        return
+
+    for future, result in zip(futures, task.result(), strict=True):
+        if not future.done():
+            future.set_result(result)
+
+
+class _MicroBatcher:
+    def __init__(
+        self, process: Callable[[list], list], max_batch_size: int, max_latency: float, executor: Executor | None
+    ):
+        if max_batch_size < 1:
+            msg = "The maximum batch size must be at least 1."
+            raise ValueError(msg)
+        if max_latency < 0:
+            msg = "The maximum latency must not be negative."
+            raise ValueError(msg)
+
+        self.process = process
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.executor = executor
+        self._items: list = []
+        self._futures: list[asyncio.Future] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def submit(self, item) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # A pending batch belongs to a loop that has stopped, e.g. after a timeout closed it
+            # before the timer fired, so it can never be dispatched and is discarded
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            self._items, self._futures = [], []
+            self._loop = loop
+
+        future = loop.create_future()
+        self._items.append(item)
+        self._futures.append(future)
+
+        if len(self._items) >= self.max_batch_size:
+            self._flush(loop)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._flush, loop)
+
+        return future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        items, futures = self._items, self._futures
+        self._items, self._futures = [], []
+
+        # Requests whose callers stopped waiting are not processed
+        if any(future.cancelled() for future in futures):
+            pending = [(item, future) for item, future in zip(items, futures, strict=True) if not future.cancelled()]
+            if not pending:
+                return
+
+            items = [item for item, _ in pending]
+            futures = [future for _, future in pending]
+
+        task = loop.run_in_executor(self.executor, self.process, items)
+        task.add_done_callback(partial(_resolve, futures))
+
+
+def _verify_items(context: Context, items: list[tuple[bytes, bytes, bytes]]) -> list[bool]:
+    signatures, msg_hashes, public_keys = zip(*items, strict=True)
+    return verify_batch(signatures, msg_hashes, public_keys, hasher=None, context=context)
+
+
+def _sign_items(private_key: PrivateKey, msg_hashes: list[bytes]) -> list[bytes]:
+    return private_key.sign_many(msg_hashes, hasher=None)
+
+
+def _hash_message(message: bytes, hasher: Hasher) -> bytes:
+    msg_hash = hasher(message) if hasher is not None else message
+    if len(msg_hash) != MSG_HASH_SIZE:
+        msg = "Message hash must be 32 bytes long."
+        raise ValueError(msg)
+
+    return msg_hash
+
+
+class Verifier:
+    def __init__(
+        self,
+        hasher: Hasher = sha256,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+        executor: Executor | None = None,
+        context: Context = GLOBAL_CONTEXT,
+    ):
+        """
+        Initializes an ECDSA signature verifier that processes requests in micro-batches.
+
+        Parameters:
+            hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
+                return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
+            max_batch_size: The maximum number of signatures verified per batch.
+            max_latency: The maximum number of seconds a request waits for its batch to fill up.
+            executor: The executor that processes batches. By default, the event loop's default executor is used.
+            context: The context to use.
+
+        Raises:
+            ValueError: If the maximum batch size is less than 1 or the maximum latency is negative.
+        """
+        self.hasher = hasher
+        self._batcher = _MicroBatcher(partial(_verify_items, context), max_batch_size, max_latency, executor)
+
+    async def verify(self, signature: bytes, message: bytes, public_key: bytes) -> bool:
+        """
+        Verifies an ECDSA signature.
+
+        Parameters:
+            signature: The ECDSA signature.
+            message: The message that was supposedly signed.
+            public_key: The formatted public key.
+
+        Returns:
+            A boolean indicating whether the signature is correct. Signatures or public keys
+            that could not be parsed are reported as incorrect.
+
+        Raises:
+            ValueError: If the message hash was not 32 bytes long.
+        """
+        return await self._batcher.submit((signature, _hash_message(message, self.hasher), public_key))
+
+    async def verify_many(
+        self, signatures: Sequence[bytes], messages: Sequence[bytes], public_keys: Sequence[bytes]
+    ) -> list[bool]:
+        """
+        Verifies many ECDSA signatures.
+
+        Parameters:
+            signatures: The ECDSA signatures.
+            messages: The messages that were supposedly signed.
+            public_keys: The formatted public keys.
+
+        Returns:
+            A list of booleans indicating whether each signature is correct. Entries whose
+            public key or signature could not be parsed are reported as incorrect.
+
+        Raises:
+            ValueError: If the number of signatures, messages, and public keys differ or a
+                message hash was not 32 bytes long.
+        """
+        if len(messages) != len(signatures) or len(public_keys) != len(signatures):
+            msg = "The number of signatures, messages, and public keys must be equal."
+            raise ValueError(msg)
+
+        items = [
+            (signature, _hash_message(message, self.hasher), public_key)
+            for signature, message, public_key in zip(signatures, messages, public_keys, strict=True)
+        ]
+        return list(await asyncio.gather(*map(self._batcher.submit, items)))
+
+
+class Signer:
+    def __init__(
+        self,
+        private_key: PrivateKey,
+        hasher: Hasher = sha256,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+        executor: Executor | None = None,
+    ):
+        """
+        Initializes an ECDSA signer that processes requests in micro-batches.
+
+        Parameters:
+            private_key: The private key with which to sign.
+            hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
+                return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
+            max_batch_size: The maximum number of messages signed per batch.
+            max_latency: The maximum number of seconds a request waits for its batch to fill up.
+            executor: The executor that processes batches. By default, the event loop's default executor is used.
+
+        Raises:
+            ValueError: If the maximum batch size is less than 1 or the maximum latency is negative.
+        """
+        self.private_key = private_key
+        self.hasher = hasher
+        self._batcher = _MicroBatcher(partial(_sign_items, private_key), max_batch_size, max_latency, executor)
+
+    async def sign(self, message: bytes) -> bytes:
+        """
+        Creates an ECDSA signature.
+
+        Parameters:
+            message: The message to sign.
+
+        Returns:
+            The ECDSA signature.
+
+        Raises:
+            ValueError: If the message hash was not 32 bytes long.
+        """
+        return await self._batcher.submit(_hash_message(message, self.hasher))
+
+    async def sign_many(self, messages: Sequence[bytes]) -> list[bytes]:
+        """
+        Creates many ECDSA signatures.
+
+        Parameters:
+            messages: The messages to sign.
+
+        Returns:
+            The ECDSA signatures.
+
+        Raises:
+            ValueError: If a message hash was not 32 bytes long.
+        """
+        msg_hashes = [_hash_message(message, self.hasher) for message in messages]
+        return list(await asyncio.gather(*map(self._batcher.submit, msg_hashes)))
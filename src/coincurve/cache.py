@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from hashlib import blake2b
+from os import urandom
+from threading import Lock
+
+from coincurve._libsecp256k1 import ffi, lib
+from coincurve.context import GLOBAL_CONTEXT, Context
+
+DEFAULT_MAX_ENTRIES = 100_000
+SALT_SIZE = 32
+
+_MISSING = object()
+
+
+class _LRUCache:
+    def __init__(self, max_entries: int):
+        if max_entries < 1:
+            msg = "The cache must be able to hold at least one entry."
+            raise ValueError(msg)
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def _get(self, key):
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+            return value
+
+    def _put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SignatureCache(_LRUCache):
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, salt: bytes | None = None):
+        """
+        Initializes a thread-safe cache of successfully verified signatures, evicting
+        the least recently used entries once full.
+
+        Entries are 32-byte salted hashes of the verified data so every entry occupies
+        the same, small amount of memory regardless of the signature scheme.
+
+        Parameters:
+            max_entries: The maximum number of entries.
+            salt: The secret salt of the hash, at most 64 bytes long. If not provided, a random salt is generated.
+
+        Raises:
+            ValueError: If the maximum number of entries is less than 1.
+        """
+        super().__init__(max_entries)
+        self._salt = salt if salt is not None else urandom(SALT_SIZE)
+
+    def key(self, *parts) -> bytes:
+        """
+        Derives the cache key of the verified data.
+
+        Parameters:
+            parts (bytes | ffi.CData): The components of the verified data, e.g. the public key, signature,
+                and message hash. C arrays and structures are hashed in place.
+
+        Returns:
+            The 32-byte cache key.
+        """
+        hasher = blake2b(digest_size=32, key=self._salt)
+        for part in parts:
+            if isinstance(part, ffi.CData):
+                part = ffi.buffer(part)  # noqa: PLW2901
+
+            # Prefixing lengths keeps the encoding of the components unambiguous
+            hasher.update(len(part).to_bytes(4, "big"))
+            hasher.update(part)
+
+        return hasher.digest()
+
+    def contains(self, key: bytes) -> bool:
+        """
+        Checks whether a cache key is present, updating the hit and miss counters.
+
+        Parameters:
+            key: The cache key.
+
+        Returns:
+            A boolean indicating whether the key was found.
+        """
+        return self._get(key) is not _MISSING
+
+    def add(self, key: bytes) -> None:
+        """
+        Adds a cache key, evicting the least recently used entry if the cache is full.
+
+        Parameters:
+            key: The cache key.
+        """
+        self._put(key, None)
+
+
+class PublicKeyCache(_LRUCache):
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initializes a thread-safe cache of parsed public keys, keyed by their formatted bytes
+        and evicting the least recently used entries once full.
+
+        Each entry holds the formatted public key and its 64-byte parsed structure.
+
+        Parameters:
+            max_entries: The maximum number of entries.
+
+        Raises:
+            ValueError: If the maximum number of entries is less than 1.
+        """
+        super().__init__(max_entries)
+
+    def parse(self, data: bytes, context: Context = GLOBAL_CONTEXT) -> ffi.CData:
+        """
+        Parses a formatted public key, reusing the result of a previous parse of the same bytes.
+
+        Parameters:
+            data: The formatted public key.
+            context: The context to use.
+
+        Returns:
+            The parsed `secp256k1_pubkey *`, which is shared by all users of the cache and must not be modified.
+
+        Raises:
+            ValueError: If the public key could not be parsed or was invalid.
+        """
+        if not isinstance(data, bytes):
+            # Entries are keyed by immutable copies of the formatted public keys
+            data = bytes(memoryview(data))
+
+        public_key = self._get(data)
+        if public_key is _MISSING:
+            public_key = ffi.new("secp256k1_pubkey *")
+
+            parsed = lib.secp256k1_ec_pubkey_parse(context.ctx, public_key, data, len(data))
+
+            if not parsed:
+                msg = "The public key could not be parsed or is invalid."
+                raise ValueError(msg)
+
+            self._put(data, public_key)
+
+        return public_key
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from os import urandom
-from threading import Lock
+from itertools import count
+from os import cpu_count, urandom
+from threading import Lock, local
 
 from coincurve._libsecp256k1 import ffi, lib
 from coincurve.flags import CONTEXT_FLAGS, CONTEXT_NONE
@@ -34,4 +35,66 @@ class Context:
         return self.name or super().__repr__()
 
 
+class ContextPool:
+    def __init__(self, size: int | None = None, flag=CONTEXT_NONE, name: str = ""):
+        """
+        Initializes a pool of independently randomized contexts, each thread being assigned one of them.
+
+        Parameters:
+            size: The number of contexts. By default, this is the number of CPUs.
+            flag: The flag used to create every context.
+            name: The name of the pool, used as a prefix for the names of its contexts.
+
+        Raises:
+            ValueError: If the size is less than 1 or the flag is invalid.
+        """
+        size = size if size is not None else cpu_count() or 1
+        if size < 1:
+            msg = "The pool must contain at least one context."
+            raise ValueError(msg)
+
+        self.flag = flag
+        self.name = name
+        self._contexts = [Context(flag=flag, name=f"{name}[{i}]" if name else "") for i in range(size)]
+        self._lock = Lock()
+        self._local = local()
+        self._assignments = count()
+        self._next_rotation = 0
+
+    def get(self) -> Context:
+        """
+        Returns the context assigned to the current thread.
+        """
+        try:
+            slot = self._local.slot
+        except AttributeError:
+            with self._lock:
+                slot = self._local.slot = next(self._assignments) % len(self._contexts)
+
+        return self._contexts[slot]
+
+    def rotate(self) -> Context:
+        """
+        Replaces the least recently rotated context with a freshly randomized one. Calling this periodically,
+        for example from a background thread, reseeds the whole pool without blocking threads that are using it.
+
+        Returns:
+            The new context.
+        """
+        with self._lock:
+            slot = self._next_rotation
+            self._next_rotation = (slot + 1) % len(self._contexts)
+
+            context = Context(flag=self.flag, name=f"{self.name}[{slot}]" if self.name else "")
+            self._contexts[slot] = context
+
+        return context
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def __repr__(self):
+        return self.name or super().__repr__()
+
+
 GLOBAL_CONTEXT = Context(name="GLOBAL_CONTEXT")
@@ -31,12 +31,22 @@ The expected DER structure is as follows:
         privateKey     OCTET STRING,                -- the secret bytes
         publicKey  [1] EXPLICIT BIT STRING OPTIONAL -- uncompressed public key
     }
+
+Keys with a 32-byte secret and an uncompressed public key, which is the only layout produced
+by `PrivateKey.to_der`, always encode to the same 135 bytes apart from the key material itself.
+Such keys are encoded and decoded by copying at fixed offsets, falling back to the general
+parser for everything else.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from coincurve.utils import int_to_bytes
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # ASN.1 DER tag bytes
 INTEGER_TAG = 0x02
 BIT_STRING_TAG = 0x03
@@ -62,6 +72,27 @@ EC_ALGORITHM_IDENTIFIER = bytes([
     *SECP256K1_OID,
 ])
 
+# Fixed layout of the canonical encoding
+PKCS8_PREFIX = bytes([
+    SEQUENCE_TAG,
+    0x81,
+    0x84,
+    *VERSION_INTEGER_ZERO,
+    *EC_ALGORITHM_IDENTIFIER,
+    OCTET_STRING_TAG,
+    0x6D,
+    SEQUENCE_TAG,
+    0x6B,
+    *VERSION_INTEGER_ONE,
+    OCTET_STRING_TAG,
+    0x20,
+])
+PKCS8_PUBLIC_KEY_PREFIX = bytes([0xA1, 0x44, BIT_STRING_TAG, 0x42, 0x00])
+PKCS8_SECRET_OFFSET = len(PKCS8_PREFIX)
+PKCS8_PUBLIC_KEY_PREFIX_OFFSET = PKCS8_SECRET_OFFSET + 32
+PKCS8_PUBLIC_KEY_OFFSET = PKCS8_PUBLIC_KEY_PREFIX_OFFSET + len(PKCS8_PUBLIC_KEY_PREFIX)
+PKCS8_LENGTH = PKCS8_PUBLIC_KEY_OFFSET + 65
+
 
 def encode_length(length: int) -> bytes:
     """Encode a length in DER format."""
@@ -109,6 +140,9 @@ def encode_der(private_key: bytes, public_key: bytes | None = None) -> bytes:
     Returns:
         The DER-encoded private key
     """
+    if len(private_key) == 32 and public_key is not None and len(public_key) == 65:  # noqa: PLR2004
+        return b"".join((PKCS8_PREFIX, private_key, PKCS8_PUBLIC_KEY_PREFIX, public_key))
+
     # EC private key contains version(1) + octet string + optional pubkey
     ec_key_buffer = bytearray(VERSION_INTEGER_ONE)
 
@@ -189,6 +223,13 @@ def decode_der(der_data: bytes) -> bytes:
     Returns:
         The private key secret as bytes
     """
+    if (
+        len(der_data) == PKCS8_LENGTH
+        and der_data[:PKCS8_SECRET_OFFSET] == PKCS8_PREFIX
+        and der_data[PKCS8_PUBLIC_KEY_PREFIX_OFFSET:PKCS8_PUBLIC_KEY_OFFSET] == PKCS8_PUBLIC_KEY_PREFIX
+    ):
+        return der_data[PKCS8_SECRET_OFFSET:PKCS8_PUBLIC_KEY_PREFIX_OFFSET]
+
     # Quick validation for performance
     if len(der_data) < 34 or der_data[0] != SEQUENCE_TAG:  # noqa: PLR2004
         msg = "Invalid DER: not a valid PKCS#8 structure"
@@ -268,3 +309,65 @@ def decode_der(der_data: bytes) -> bytes:
 
     # Extract private key
     return ec_data[ec_offset : ec_offset + key_len]
+
+
+def encode_der_many(private_keys: bytes, public_keys: bytes) -> list[bytes]:
+    """
+    Encode many EC private keys in DER format (PKCS#8/RFC 5208) using the canonical layout.
+
+    Parameters:
+        private_keys: The concatenated 32-byte private keys
+        public_keys: The concatenated 65-byte uncompressed public keys, one per private key
+
+    Returns:
+        The DER-encoded private keys
+
+    Raises:
+        ValueError: If the private or public keys are not all of the expected length
+    """
+    private_view = memoryview(private_keys).cast("B")
+    public_view = memoryview(public_keys).cast("B")
+    if len(private_view) % 32:
+        msg = "Private keys must be 32 bytes long each."
+        raise ValueError(msg)
+
+    count = len(private_view) // 32
+    if len(public_view) != 65 * count:
+        msg = "Public keys must be 65 bytes long each."
+        raise ValueError(msg)
+
+    join = b"".join
+    return [
+        join((
+            PKCS8_PREFIX,
+            private_view[32 * i : 32 * i + 32],
+            PKCS8_PUBLIC_KEY_PREFIX,
+            public_view[65 * i : 65 * i + 65],
+        ))
+        for i in range(count)
+    ]
+
+
+def decode_der_many(der_data: Sequence[bytes]) -> bytes:
+    """
+    Decode many DER-encoded EC private keys to extract the private key secrets.
+
+    Parameters:
+        der_data: The DER-encoded private keys in PKCS#8 format
+
+    Returns:
+        The concatenated private key secrets, each left-padded to 32 bytes
+
+    Raises:
+        ValueError: If a private key could not be decoded or its secret is longer than 32 bytes
+    """
+    secrets = bytearray(32 * len(der_data))
+    for i, der in enumerate(der_data):
+        secret = decode_der(der)
+        if len(secret) > 32:  # noqa: PLR2004
+            msg = f"The private key at index {i} is longer than 32 bytes."
+            raise ValueError(msg)
+
+        secrets[32 * i + 32 - len(secret) : 32 * i + 32] = secret
+
+    return bytes(secrets)
@@ -4,10 +4,18 @@ from typing import TYPE_CHECKING
 
 from coincurve._libsecp256k1 import ffi, lib
 from coincurve.context import GLOBAL_CONTEXT, Context
-from coincurve.utils import bytes_to_int, int_to_bytes, sha256
+from coincurve.utils import (
+    SIGNATURE_ENCODINGS,
+    as_buffer,
+    int_to_bytes,
+    sha256,
+    signature_parser,
+    validate_signature_encoding,
+    writable_buffer,
+)
 
 if TYPE_CHECKING:
-    from coincurve.types import Hasher
+    from coincurve.types import Hasher, SignatureEncoding
 
 MAX_SIG_LENGTH = 72
 CDATA_SIG_LENGTH = 64
@@ -22,8 +30,20 @@ def cdata_to_der(cdata, context: Context = GLOBAL_CONTEXT) -> bytes:
     return bytes(ffi.buffer(der, der_length[0]))
 
 
+def cdata_to_der_into(cdata, out: bytearray, offset: int = 0, context: Context = GLOBAL_CONTEXT) -> int:
+    buffer = writable_buffer(out, offset, 0)
+    der_length = ffi.new("size_t *", min(MAX_SIG_LENGTH, len(buffer) - offset))
+
+    if not lib.secp256k1_ecdsa_signature_serialize_der(context.ctx, buffer + offset, der_length, cdata):
+        msg = "The output buffer does not have enough space at the given offset."
+        raise ValueError(msg)
+
+    return der_length[0]
+
+
 def der_to_cdata(der: bytes, context: Context = GLOBAL_CONTEXT):
     cdata = ffi.new("secp256k1_ecdsa_signature *")
+    der = as_buffer(der)
     parsed = lib.secp256k1_ecdsa_signature_parse_der(context.ctx, cdata, der, len(der))
 
     if not parsed:
@@ -34,7 +54,7 @@ def der_to_cdata(der: bytes, context: Context = GLOBAL_CONTEXT):
 
 
 def recover(message: bytes, recover_sig, hasher: Hasher = sha256, context: Context = GLOBAL_CONTEXT):
-    msg_hash = hasher(message) if hasher is not None else message
+    msg_hash = as_buffer(hasher(message) if hasher is not None else message)
     if len(msg_hash) != 32:  # noqa: PLR2004
         msg = "Message hash must be 32 bytes long."
         raise ValueError(msg)
@@ -56,12 +76,24 @@ def serialize_recoverable(recover_sig, context: Context = GLOBAL_CONTEXT) -> byt
     return bytes(ffi.buffer(output, CDATA_SIG_LENGTH)) + int_to_bytes(recid[0])
 
 
+def serialize_recoverable_into(recover_sig, out: bytearray, offset: int = 0, context: Context = GLOBAL_CONTEXT) -> int:
+    buffer = writable_buffer(out, offset, CDATA_SIG_LENGTH + 1)
+    recid = ffi.new("int *")
+
+    lib.secp256k1_ecdsa_recoverable_signature_serialize_compact(context.ctx, buffer + offset, recid, recover_sig)
+    buffer[offset + CDATA_SIG_LENGTH] = recid[0]
+
+    return CDATA_SIG_LENGTH + 1
+
+
 def deserialize_recoverable(serialized: bytes, context: Context = GLOBAL_CONTEXT):
+    serialized = as_buffer(serialized)
     if len(serialized) != 65:  # noqa: PLR2004
         msg = "Serialized signature must be 65 bytes long."
         raise ValueError(msg)
 
-    ser_sig, rec_id = serialized[:64], bytes_to_int(serialized[64:])
+    # Parsing only reads the first 64 bytes so the input can be passed as is
+    ser_sig, rec_id = serialized, serialized[64]
 
     if not 0 <= rec_id <= 3:  # noqa: PLR2004
         msg = "Invalid recovery id."
@@ -77,38 +109,71 @@ def deserialize_recoverable(serialized: bytes, context: Context = GLOBAL_CONTEXT
     return recover_sig
 
 
-"""
-Warning:
-    The functions below may change and are not tested!
-"""
-
-
-def serialize_compact(raw_sig, context: Context = GLOBAL_CONTEXT):  # no cov
+def serialize_compact(raw_sig, context: Context = GLOBAL_CONTEXT) -> bytes:
     output = ffi.new("unsigned char[64]")
 
-    res = lib.secp256k1_ecdsa_signature_serialize_compact(context.ctx, output, raw_sig)
-    if not res:
-        msg = "secp256k1_ecdsa_signature_serialize_compact"
-        raise ValueError(msg)
+    lib.secp256k1_ecdsa_signature_serialize_compact(context.ctx, output, raw_sig)
 
     return bytes(ffi.buffer(output, CDATA_SIG_LENGTH))
 
 
-def deserialize_compact(ser_sig: bytes, context: Context = GLOBAL_CONTEXT):  # no cov
-    if len(ser_sig) != 64:  # noqa: PLR2004
-        msg = "invalid signature length"
+def serialize_compact_into(raw_sig, out: bytearray, offset: int = 0, context: Context = GLOBAL_CONTEXT) -> int:
+    buffer = writable_buffer(out, offset, CDATA_SIG_LENGTH)
+
+    lib.secp256k1_ecdsa_signature_serialize_compact(context.ctx, buffer + offset, raw_sig)
+
+    return CDATA_SIG_LENGTH
+
+
+def deserialize_compact(ser_sig: bytes, context: Context = GLOBAL_CONTEXT):
+    ser_sig = as_buffer(ser_sig)
+    if len(ser_sig) != CDATA_SIG_LENGTH:
+        msg = "Compact signature must be 64 bytes long."
         raise ValueError(msg)
 
     raw_sig = ffi.new("secp256k1_ecdsa_signature *")
     res = lib.secp256k1_ecdsa_signature_parse_compact(context.ctx, raw_sig, ser_sig)
     if not res:
-        msg = "secp256k1_ecdsa_signature_parse_compact"
+        msg = "The compact signature could not be parsed."
+        raise ValueError(msg)
+
+    return raw_sig
+
+
+def serialize_signature(raw_sig, encoding: SignatureEncoding = "der", context: Context = GLOBAL_CONTEXT) -> bytes:
+    validate_signature_encoding(encoding)
+    if encoding == "compact":
+        return serialize_compact(raw_sig, context)
+
+    return cdata_to_der(raw_sig, context)
+
+
+def serialize_signature_into(
+    raw_sig,
+    out: bytearray,
+    offset: int = 0,
+    encoding: SignatureEncoding = "der",
+    context: Context = GLOBAL_CONTEXT,
+) -> int:
+    validate_signature_encoding(encoding)
+    if encoding == "compact":
+        return serialize_compact_into(raw_sig, out, offset, context)
+
+    return cdata_to_der_into(raw_sig, out, offset, context)
+
+
+def deserialize_signature(ser_sig: bytes, encoding: SignatureEncoding = "der", context: Context = GLOBAL_CONTEXT):
+    raw_sig = ffi.new("secp256k1_ecdsa_signature *")
+    ser_sig = as_buffer(ser_sig)
+
+    if not signature_parser(encoding)(context.ctx, raw_sig, ser_sig, len(ser_sig)):
+        msg = f"The {SIGNATURE_ENCODINGS[encoding]} signature could not be parsed."
         raise ValueError(msg)
 
     return raw_sig
 
 
-def signature_normalize(raw_sig, context: Context = GLOBAL_CONTEXT):  # no cov
+def signature_normalize(raw_sig, context: Context = GLOBAL_CONTEXT):
     """
     Check and optionally convert a signature to a normalized lower-S form.
 
@@ -123,7 +188,7 @@ def signature_normalize(raw_sig, context: Context = GLOBAL_CONTEXT):  # no cov
     return not not res, sigout  # noqa: SIM208
 
 
-def recoverable_convert(recover_sig, context: Context = GLOBAL_CONTEXT):  # no cov
+def recoverable_convert(recover_sig, context: Context = GLOBAL_CONTEXT):
     normal_sig = ffi.new("secp256k1_ecdsa_signature *")
 
     lib.secp256k1_ecdsa_recoverable_signature_convert(context.ctx, normal_sig, recover_sig)
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import os
+from array import array
+from bisect import bisect_left
 from typing import TYPE_CHECKING
 
 from coincurve._libsecp256k1 import ffi, lib
 from coincurve.context import GLOBAL_CONTEXT, Context
 from coincurve.der import decode_der, encode_der
-from coincurve.ecdsa import cdata_to_der, der_to_cdata, deserialize_recoverable, recover, serialize_recoverable
+from coincurve.ecdsa import (
+    CDATA_SIG_LENGTH,
+    MAX_SIG_LENGTH,
+    deserialize_recoverable,
+    deserialize_signature,
+    recover,
+    recoverable_convert,
+    serialize_recoverable,
+    serialize_recoverable_into,
+    serialize_signature,
+    serialize_signature_into,
+    signature_normalize,
+)
 from coincurve.flags import EC_COMPRESSED, EC_UNCOMPRESSED
 from coincurve.utils import (
+    DEFAULT_ECDH_HASH,
     DEFAULT_NONCE,
+    KEY_SIZE,
+    as_buffer,
     bytes_to_int,
     der_to_pem,
     get_valid_secret,
@@ -18,14 +35,22 @@ from coincurve.utils import (
     pad_scalar,
     pem_to_der,
     sha256,
+    signature_parser,
     validate_secret,
+    validate_signature_encoding,
+    writable_buffer,
 )
 
 if TYPE_CHECKING:
-    from coincurve.types import Hasher, Nonce
+    from collections.abc import Sequence
+
+    from coincurve.cache import PublicKeyCache, SignatureCache
+    from coincurve.types import EcdhHash, Hasher, Nonce, SignatureEncoding
 
 
 class PrivateKey:
+    __slots__ = ("__weakref__", "_keypair", "_public_key", "_public_key_xonly", "context", "secret")
+
     def __init__(self, secret: bytes | None = None, context: Context = GLOBAL_CONTEXT):
         """
         Initializes a private key.
@@ -37,10 +62,45 @@ class PrivateKey:
         """
         self.secret: bytes = validate_secret(secret) if secret is not None else get_valid_secret()
         self.context = context
-        self.public_key: PublicKey = PublicKey.from_valid_secret(self.secret, self.context)
-        self.public_key_xonly: PublicKeyXOnly = PublicKeyXOnly.from_valid_secret(self.secret, self.context)
+        self._public_key: PublicKey | None = None
+        self._public_key_xonly: PublicKeyXOnly | None = None
+        self._keypair: ffi.CData | None = None
+
+    @property
+    def public_key(self) -> PublicKey:
+        """
+        The public key, derived on first access.
+        """
+        if self._public_key is None:
+            self._public_key = PublicKey.from_valid_secret(self.secret, self.context)
+
+        return self._public_key
+
+    @public_key.setter
+    def public_key(self, public_key: PublicKey) -> None:
+        self._public_key = public_key
 
-    def sign(self, message: bytes, hasher: Hasher = sha256, custom_nonce: Nonce = DEFAULT_NONCE) -> bytes:
+    @property
+    def public_key_xonly(self) -> PublicKeyXOnly:
+        """
+        The BIP340 `x-only` public key, derived on first access.
+        """
+        if self._public_key_xonly is None:
+            self._public_key_xonly = PublicKeyXOnly._from_keypair(self._get_keypair(), self.context)  # noqa: SLF001
+
+        return self._public_key_xonly
+
+    @public_key_xonly.setter
+    def public_key_xonly(self, public_key_xonly: PublicKeyXOnly) -> None:
+        self._public_key_xonly = public_key_xonly
+
+    def sign(
+        self,
+        message: bytes,
+        hasher: Hasher = sha256,
+        custom_nonce: Nonce = DEFAULT_NONCE,
+        encoding: SignatureEncoding = "der",
+    ) -> bytes:
         """
         Creates an ECDSA signature.
 
@@ -51,31 +111,115 @@ class PrivateKey:
             custom_nonce (tuple[ffi.CData, ffi.CData]): Custom nonce data in the form `(nonce_function, input_data)`.
                 For more information, refer to the `libsecp256k1` documentation
                 [here](https://github.com/bitcoin-core/secp256k1/blob/v0.6.0/include/secp256k1.h#L637-L642).
+            encoding: The encoding of the signature, either `der` or the 64 byte `compact` format.
 
         Returns:
             The ECDSA signature.
 
         Raises:
             ValueError: If the message hash was not 32 bytes long, the nonce generation
-                        function failed, or the private key was invalid.
+                        function failed, the private key was invalid, or the encoding is unknown.
         """
-        msg_hash = hasher(message) if hasher is not None else message
-        if len(msg_hash) != 32:  # noqa: PLR2004
-            msg = "Message hash must be 32 bytes long."
-            raise ValueError(msg)
+        validate_signature_encoding(encoding)
+        return serialize_signature(self._sign(message, hasher, custom_nonce), encoding, self.context)
 
-        signature = ffi.new("secp256k1_ecdsa_signature *")
+    def sign_into(
+        self,
+        message: bytes,
+        out: bytearray,
+        offset: int = 0,
+        hasher: Hasher = sha256,
+        custom_nonce: Nonce = DEFAULT_NONCE,
+        encoding: SignatureEncoding = "der",
+    ) -> int:
+        """
+        Creates an ECDSA signature, writing it directly into a preallocated buffer.
+
+        Parameters:
+            message: The message to sign.
+            out: The writable buffer, e.g. a `bytearray` or `memoryview`, which receives the signature.
+            offset: The position in the buffer at which to write the signature.
+            hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
+                return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
+            custom_nonce (tuple[ffi.CData, ffi.CData]): Custom nonce data in the form `(nonce_function, input_data)`.
+                For more information, refer to the `libsecp256k1` documentation
+                [here](https://github.com/bitcoin-core/secp256k1/blob/v0.6.0/include/secp256k1.h#L637-L642).
+            encoding: The encoding of the signature, either `der` or the 64 byte `compact` format.
+
+        Returns:
+            The length of the written ECDSA signature, which is at most 72 bytes for the `der`
+            encoding and always 64 bytes for the `compact` encoding.
+
+        Raises:
+            ValueError: If the message hash was not 32 bytes long, the nonce generation
+                        function failed, the private key was invalid, the encoding is
+                        unknown, or the buffer did not have enough space at the offset.
+        """
+        validate_signature_encoding(encoding)
+        return serialize_signature_into(self._sign(message, hasher, custom_nonce), out, offset, encoding, self.context)
+
+    def sign_many(
+        self,
+        messages: Sequence[bytes],
+        hasher: Hasher = sha256,
+        custom_nonce: Nonce = DEFAULT_NONCE,
+        encoding: SignatureEncoding = "der",
+    ) -> list[bytes]:
+        """
+        Creates many ECDSA signatures, reusing the same signature and serialization buffers for every message.
+
+        Parameters:
+            messages: The messages to sign.
+            hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
+                return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
+            custom_nonce (tuple[ffi.CData, ffi.CData]): Custom nonce data in the form `(nonce_function, input_data)`.
+                For more information, refer to the `libsecp256k1` documentation
+                [here](https://github.com/bitcoin-core/secp256k1/blob/v0.6.0/include/secp256k1.h#L637-L642).
+            encoding: The encoding of the signatures, either `der` or the 64 byte `compact` format.
+
+        Returns:
+            The ECDSA signatures.
+
+        Raises:
+            ValueError: If a message hash was not 32 bytes long, the nonce generation
+                        function failed, the private key was invalid, or the encoding is unknown.
+        """
+        validate_signature_encoding(encoding)
+        compact = encoding == "compact"
+        ctx = self.context.ctx
+        secret = self.secret
         nonce_fn, nonce_data = custom_nonce
+        signature = ffi.new("secp256k1_ecdsa_signature *")
+        der = ffi.new("unsigned char[%d]" % MAX_SIG_LENGTH)  # noqa: UP031
+        der_length = ffi.new("size_t *")
+        ecdsa_sign = lib.secp256k1_ecdsa_sign
+        signature_serialize_der = lib.secp256k1_ecdsa_signature_serialize_der
+        signature_serialize_compact = lib.secp256k1_ecdsa_signature_serialize_compact
+        buffer = ffi.buffer
+
+        signatures: list[bytes] = []
+        append = signatures.append
+        for message in messages:
+            msg_hash = as_buffer(hasher(message) if hasher is not None else message)
+            if len(msg_hash) != 32:  # noqa: PLR2004
+                msg = "Message hash must be 32 bytes long."
+                raise ValueError(msg)
 
-        signed = lib.secp256k1_ecdsa_sign(self.context.ctx, signature, msg_hash, self.secret, nonce_fn, nonce_data)
+            if not ecdsa_sign(ctx, signature, msg_hash, secret, nonce_fn, nonce_data):
+                msg = "The nonce generation function failed, or the private key was invalid."
+                raise ValueError(msg)
 
-        if not signed:
-            msg = "The nonce generation function failed, or the private key was invalid."
-            raise ValueError(msg)
+            if compact:
+                signature_serialize_compact(ctx, der, signature)
+                append(buffer(der, CDATA_SIG_LENGTH)[:])
+            else:
+                der_length[0] = MAX_SIG_LENGTH
+                signature_serialize_der(ctx, der, der_length, signature)
+                append(buffer(der, der_length[0])[:])
 
-        return cdata_to_der(signature, self.context)
+        return signatures
 
-    def sign_schnorr(self, message: bytes, aux_randomness: bytes = b"") -> bytes:
+    def sign_schnorr(self, message: bytes, aux_randomness: bytes = b"", verify: bool = True) -> bytes:  # noqa: FBT001, FBT002
         """
         Creates a Schnorr signature.
 
@@ -83,6 +227,8 @@ class PrivateKey:
             message: The message to sign.
             aux_randomness: 32 bytes of fresh randomness, empty bytestring (auto-generated),
                 or None (no randomness).
+            verify: Whether to verify the signature after creating it, which guards against faults
+                during signing at roughly the cost of a verification.
 
         Returns:
             The Schnorr signature.
@@ -91,37 +237,43 @@ class PrivateKey:
             ValueError: If the message was not 32 bytes long, the optional auxiliary
                 random data was not 32 bytes long, signing failed, or the signature was invalid.
         """
-        if len(message) != 32:  # noqa: PLR2004
-            msg = "Message must be 32 bytes long."
-            raise ValueError(msg)
-        if aux_randomness == b"":
-            aux_randomness = os.urandom(32)
-        elif aux_randomness is None:
-            aux_randomness = ffi.NULL
-        elif len(aux_randomness) != 32:  # noqa: PLR2004
-            msg = "Auxiliary random data must be 32 bytes long."
-            raise ValueError(msg)
+        signature = ffi.new("unsigned char[64]")
+        self._sign_schnorr(signature, message, aux_randomness, verify)
 
-        keypair = ffi.new("secp256k1_keypair *")
-        res = lib.secp256k1_keypair_create(self.context.ctx, keypair, self.secret)
-        if not res:
-            msg = "Secret was invalid"
-            raise ValueError(msg)
+        return bytes(ffi.buffer(signature))
 
-        signature = ffi.new("unsigned char[64]")
-        res = lib.secp256k1_schnorrsig_sign32(self.context.ctx, signature, message, keypair, aux_randomness)
-        if not res:
-            msg = "Signing failed"
-            raise ValueError(msg)
+    def sign_schnorr_into(
+        self,
+        message: bytes,
+        out: bytearray,
+        offset: int = 0,
+        aux_randomness: bytes = b"",
+        verify: bool = True,  # noqa: FBT001, FBT002
+    ) -> int:
+        """
+        Creates a Schnorr signature, writing it directly into a preallocated buffer.
 
-        res = lib.secp256k1_schnorrsig_verify(
-            self.context.ctx, signature, message, len(message), self.public_key_xonly.public_key
-        )
-        if not res:
-            msg = "Invalid signature"
-            raise ValueError(msg)
+        Parameters:
+            message: The message to sign.
+            out: The writable buffer, e.g. a `bytearray` or `memoryview`, which receives the signature.
+            offset: The position in the buffer at which to write the signature.
+            aux_randomness: 32 bytes of fresh randomness, empty bytestring (auto-generated),
+                or None (no randomness).
+            verify: Whether to verify the signature after creating it, which guards against faults
+                during signing at roughly the cost of a verification.
 
-        return bytes(ffi.buffer(signature))
+        Returns:
+            The length of the written Schnorr signature, which is always 64 bytes.
+
+        Raises:
+            ValueError: If the message was not 32 bytes long, the optional auxiliary
+                random data was not 32 bytes long, signing failed, the signature was invalid,
+                or the buffer did not have enough space at the offset.
+        """
+        buffer = writable_buffer(out, offset, 64)
+        self._sign_schnorr(buffer + offset, message, aux_randomness, verify)
+
+        return 64
 
     def sign_recoverable(self, message: bytes, hasher: Hasher = sha256, custom_nonce: Nonce = DEFAULT_NONCE) -> bytes:
         """
@@ -142,46 +294,135 @@ class PrivateKey:
             ValueError: If the message hash was not 32 bytes long, the nonce generation
                 function failed, or the private key was invalid.
         """
-        msg_hash = hasher(message) if hasher is not None else message
-        if len(msg_hash) != 32:  # noqa: PLR2004
-            msg = "Message hash must be 32 bytes long."
-            raise ValueError(msg)
+        return serialize_recoverable(self._sign_recoverable(message, hasher, custom_nonce), self.context)
 
-        signature = ffi.new("secp256k1_ecdsa_recoverable_signature *")
-        nonce_fn, nonce_data = custom_nonce
+    def sign_recoverable_into(
+        self,
+        message: bytes,
+        out: bytearray,
+        offset: int = 0,
+        hasher: Hasher = sha256,
+        custom_nonce: Nonce = DEFAULT_NONCE,
+    ) -> int:
+        """
+        Creates a recoverable ECDSA signature, writing it directly into a preallocated buffer.
 
-        signed = lib.secp256k1_ecdsa_sign_recoverable(
-            self.context.ctx, signature, msg_hash, self.secret, nonce_fn, nonce_data
-        )
+        Parameters:
+            message: The message to sign.
+            out: The writable buffer, e.g. a `bytearray` or `memoryview`, which receives the signature.
+            offset: The position in the buffer at which to write the signature.
+            hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
+                return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
+            custom_nonce (tuple[ffi.CData, ffi.CData]): Custom nonce data in the form `(nonce_function, input_data)`.
+                For more information, refer to the `libsecp256k1` documentation
+                [here](https://github.com/bitcoin-core/secp256k1/blob/v0.6.0/include/secp256k1.h#L637-L642).
 
-        if not signed:
-            msg = "The nonce generation function failed, or the private key was invalid."
-            raise ValueError(msg)
+        Returns:
+            The length of the written recoverable ECDSA signature, which is always 65 bytes.
 
-        return serialize_recoverable(signature, self.context)
+        Raises:
+            ValueError: If the message hash was not 32 bytes long, the nonce generation
+                function failed, the private key was invalid, or the buffer did not
+                have enough space at the offset.
+        """
+        return serialize_recoverable_into(
+            self._sign_recoverable(message, hasher, custom_nonce), out, offset, self.context
+        )
 
-    def ecdh(self, public_key: bytes) -> bytes:
+    def ecdh(
+        self,
+        public_key: bytes,
+        public_key_cache: PublicKeyCache | None = None,
+        custom_hash: EcdhHash = DEFAULT_ECDH_HASH,
+        output_size: int = 32,
+    ) -> bytes:
         """
         Computes an EC Diffie-Hellman secret in constant time.
 
         !!! note
-            This prevents malleability by returning `sha256(compressed_public_key)` instead of the `x` coordinate
-            directly.
+            By default, this prevents malleability by returning `sha256(compressed_public_key)` instead of
+            the `x` coordinate directly.
 
         Parameters:
             public_key: The formatted public key.
+            public_key_cache: A cache of parsed public keys to consult and update.
+            custom_hash (tuple[ffi.CData, ffi.CData]): A custom hash function in the form `(hash_function, data)`.
+                For more information, refer to the `libsecp256k1` documentation
+                [here](https://github.com/bitcoin-core/secp256k1/blob/v0.6.0/include/secp256k1_ecdh.h#L10-L23).
+            output_size: The number of bytes written by the hash function.
 
         Returns:
-            The 32-byte shared secret.
+            The shared secret.
 
         Raises:
-            ValueError: If the public key could not be parsed or was invalid.
+            ValueError: If the public key could not be parsed or was invalid, the output size was
+                too small for the default hash function, or the hash function failed.
+        """
+        hashfp, data = custom_hash
+        if hashfp == ffi.NULL and output_size < 32:  # noqa: PLR2004
+            msg = "The output size is too small for the default hash function."
+            raise ValueError(msg)
+
+        secret = ffi.new("unsigned char []", output_size)
+
+        if public_key_cache is not None:
+            parsed_public_key = public_key_cache.parse(public_key, self.context)
+        else:
+            parsed_public_key = PublicKey(public_key).public_key
+
+        if not lib.secp256k1_ecdh(self.context.ctx, secret, parsed_public_key, self.secret, hashfp, data):
+            msg = "The hash function failed."
+            raise ValueError(msg)
+
+        return bytes(ffi.buffer(secret))
+
+    def ecdh_many(
+        self,
+        public_keys: PublicKeyArray | bytes,
+        key_size: int = 33,
+        custom_hash: EcdhHash = DEFAULT_ECDH_HASH,
+        output_size: int = 32,
+    ) -> bytes:
+        """
+        Computes EC Diffie-Hellman secrets with many public keys in constant time, writing them
+        into a single buffer.
+
+        Parameters:
+            public_keys: The public keys, or the concatenated formatted public keys.
+            key_size: The size of each formatted public key, if not already parsed.
+            custom_hash (tuple[ffi.CData, ffi.CData]): A custom hash function in the form `(hash_function, data)`.
+                For more information, refer to the `libsecp256k1` documentation
+                [here](https://github.com/bitcoin-core/secp256k1/blob/v0.6.0/include/secp256k1_ecdh.h#L10-L23).
+            output_size: The number of bytes written by the hash function.
+
+        Returns:
+            The concatenated shared secrets, each of which is `output_size` bytes long.
+
+        Raises:
+            ValueError: If a public key could not be parsed or was invalid, the output size was
+                too small for the default hash function, or the hash function failed.
         """
-        secret = ffi.new("unsigned char [32]")
+        hashfp, data = custom_hash
+        if hashfp == ffi.NULL and output_size < 32:  # noqa: PLR2004
+            msg = "The output size is too small for the default hash function."
+            raise ValueError(msg)
+
+        if not isinstance(public_keys, PublicKeyArray):
+            public_keys = PublicKeyArray(public_keys, key_size, self.context)
 
-        lib.secp256k1_ecdh(self.context.ctx, secret, PublicKey(public_key).public_key, self.secret, ffi.NULL, ffi.NULL)
+        ctx = self.context.ctx
+        secret = self.secret
+        count = len(public_keys)
+        parsed_public_keys = public_keys.public_keys
+        secrets = ffi.new("unsigned char []", output_size * count)
+        ecdh = lib.secp256k1_ecdh
+
+        for i in range(count):
+            if not ecdh(ctx, secrets + output_size * i, parsed_public_keys + i, secret, hashfp, data):
+                msg = f"The hash function failed for the public key at index {i}."
+                raise ValueError(msg)
 
-        return bytes(ffi.buffer(secret, 32))
+        return bytes(ffi.buffer(secrets))
 
     def add(self, scalar: bytes, update: bool = False) -> PrivateKey:  # noqa: FBT001, FBT002
         """
@@ -322,13 +563,96 @@ class PrivateKey:
         """
         return PrivateKey(decode_der(der), context)
 
-    def _update_public_key(self):
-        created = lib.secp256k1_ec_pubkey_create(self.context.ctx, self.public_key.public_key, self.secret)
+    def _sign(self, message: bytes, hasher: Hasher, custom_nonce: Nonce) -> ffi.CData:
+        msg_hash = as_buffer(hasher(message) if hasher is not None else message)
+        if len(msg_hash) != 32:  # noqa: PLR2004
+            msg = "Message hash must be 32 bytes long."
+            raise ValueError(msg)
 
-        if not created:
-            msg = "Invalid secret."
+        signature = ffi.new("secp256k1_ecdsa_signature *")
+        nonce_fn, nonce_data = custom_nonce
+
+        signed = lib.secp256k1_ecdsa_sign(self.context.ctx, signature, msg_hash, self.secret, nonce_fn, nonce_data)
+
+        if not signed:
+            msg = "The nonce generation function failed, or the private key was invalid."
+            raise ValueError(msg)
+
+        return signature
+
+    def _sign_schnorr(self, signature: ffi.CData, message: bytes, aux_randomness: bytes, verify: bool) -> None:  # noqa: FBT001
+        message = as_buffer(message)
+        if len(message) != 32:  # noqa: PLR2004
+            msg = "Message must be 32 bytes long."
+            raise ValueError(msg)
+        if aux_randomness is None:
+            aux_randomness = ffi.NULL
+        elif not len(aux_randomness):
+            aux_randomness = os.urandom(32)
+        else:
+            aux_randomness = as_buffer(aux_randomness)
+            if len(aux_randomness) != 32:  # noqa: PLR2004
+                msg = "Auxiliary random data must be 32 bytes long."
+                raise ValueError(msg)
+
+        keypair = self._get_keypair()
+
+        res = lib.secp256k1_schnorrsig_sign32(self.context.ctx, signature, message, keypair, aux_randomness)
+        if not res:
+            msg = "Signing failed"
             raise ValueError(msg)
 
+        if verify:
+            res = lib.secp256k1_schnorrsig_verify(
+                self.context.ctx, signature, message, len(message), self.public_key_xonly.public_key
+            )
+            if not res:
+                msg = "Invalid signature"
+                raise ValueError(msg)
+
+    def _sign_recoverable(self, message: bytes, hasher: Hasher, custom_nonce: Nonce) -> ffi.CData:
+        msg_hash = as_buffer(hasher(message) if hasher is not None else message)
+        if len(msg_hash) != 32:  # noqa: PLR2004
+            msg = "Message hash must be 32 bytes long."
+            raise ValueError(msg)
+
+        signature = ffi.new("secp256k1_ecdsa_recoverable_signature *")
+        nonce_fn, nonce_data = custom_nonce
+
+        signed = lib.secp256k1_ecdsa_sign_recoverable(
+            self.context.ctx, signature, msg_hash, self.secret, nonce_fn, nonce_data
+        )
+
+        if not signed:
+            msg = "The nonce generation function failed, or the private key was invalid."
+            raise ValueError(msg)
+
+        return signature
+
+    def _get_keypair(self) -> ffi.CData:
+        if self._keypair is None:
+            keypair = ffi.new("secp256k1_keypair *")
+            res = lib.secp256k1_keypair_create(self.context.ctx, keypair, self.secret)
+            if not res:
+                msg = "Secret was invalid"
+                raise ValueError(msg)
+
+            self._keypair = keypair
+
+        return self._keypair
+
+    def _update_public_key(self):
+        # Public keys that were already handed out are updated in-place, others are derived on next access
+        if self._public_key is not None:
+            created = lib.secp256k1_ec_pubkey_create(self.context.ctx, self._public_key.public_key, self.secret)
+
+            if not created:
+                msg = "Invalid secret."
+                raise ValueError(msg)
+
+        self._public_key_xonly = None
+        self._keypair = None
+
     def __eq__(self, other) -> bool:
         return self.secret == other.secret
 
@@ -337,24 +661,36 @@ class PrivateKey:
 
 
 class PublicKey:
-    def __init__(self, data: bytes | ffi.CData, context: Context = GLOBAL_CONTEXT):
+    __slots__ = ("__weakref__", "context", "public_key")
+
+    def __init__(
+        self,
+        data: bytes | ffi.CData,
+        context: Context = GLOBAL_CONTEXT,
+        public_key_cache: PublicKeyCache | None = None,
+    ):
         """
         Initializes a public key.
 
         Parameters:
-            data (bytes): The formatted public key. This class supports parsing
+            data (bytes): The formatted public key, which may be any C-contiguous object supporting the
+                buffer protocol, e.g. a `bytearray` or `memoryview`. This class supports parsing
                 compressed (33 bytes, header byte `0x02` or `0x03`),
                 uncompressed (65 bytes, header byte `0x04`), or
                 hybrid (65 bytes, header byte `0x06` or `0x07`) format public keys.
             context: The context to use.
+            public_key_cache: A cache of parsed public keys to consult and update.
 
         Raises:
             ValueError: If the public key could not be parsed or was invalid.
         """
-        if not isinstance(data, bytes):
+        if isinstance(data, ffi.CData):
             self.public_key = data
+        elif public_key_cache is not None:
+            self.public_key = ffi.new("secp256k1_pubkey *", public_key_cache.parse(data, context)[0])
         else:
             public_key = ffi.new("secp256k1_pubkey *")
+            data = as_buffer(data)
 
             parsed = lib.secp256k1_ec_pubkey_parse(context.ctx, public_key, data, len(data))
 
@@ -408,8 +744,14 @@ class PublicKey:
             The public key.
 
         Raises:
-            ValueError: If the secret was invalid.
+            ValueError: If the secret was not 32 bytes long or was invalid.
         """
+        # libsecp256k1 always reads 32 bytes so the length must be checked for every input
+        secret = as_buffer(secret)
+        if len(secret) != KEY_SIZE:
+            msg = "Secret must be 32 bytes long."
+            raise ValueError(msg)
+
         public_key = ffi.new("secp256k1_pubkey *")
 
         created = lib.secp256k1_ec_pubkey_create(context.ctx, public_key, secret)
@@ -420,6 +762,53 @@ class PublicKey:
 
         return PublicKey(public_key, context)
 
+    @classmethod
+    def from_secrets(
+        cls,
+        secrets: bytes,
+        compressed: bool = True,  # noqa: FBT001, FBT002
+        context: Context = GLOBAL_CONTEXT,
+    ) -> bytes:
+        """
+        Derives and formats the public keys of many private key secrets, without creating any key objects.
+
+        Parameters:
+            secrets: The concatenated 32 byte private key secrets.
+            compressed: Whether to use the compressed format.
+            context: The context to use.
+
+        Returns:
+            The concatenated 33 byte formatted public keys, or the concatenated 65 byte
+            formatted public keys if `compressed` is `False`.
+
+        Raises:
+            ValueError: If the secrets are not all 32 bytes long or a secret was invalid.
+        """
+        secrets_buffer = ffi.from_buffer(secrets)
+        if len(secrets_buffer) % 32:
+            msg = "Secrets must be 32 bytes long each."
+            raise ValueError(msg)
+
+        ctx = context.ctx
+        count = len(secrets_buffer) // 32
+        length = 33 if compressed else 65
+        flags = EC_COMPRESSED if compressed else EC_UNCOMPRESSED
+        serialized = ffi.new("unsigned char []", length * count)
+        public_key = ffi.new("secp256k1_pubkey *")
+        output_len = ffi.new("size_t *")
+        pubkey_create = lib.secp256k1_ec_pubkey_create
+        pubkey_serialize = lib.secp256k1_ec_pubkey_serialize
+
+        for i in range(count):
+            if not pubkey_create(ctx, public_key, secrets_buffer + 32 * i):
+                msg = f"The secret at index {i} is invalid."
+                raise ValueError(msg)
+
+            output_len[0] = length
+            pubkey_serialize(ctx, serialized + length * i, output_len, public_key, flags)
+
+        return bytes(ffi.buffer(serialized))
+
     @classmethod
     def from_point(cls, x: int, y: int, context: Context = GLOBAL_CONTEXT) -> PublicKey:
         """
@@ -437,13 +826,17 @@ class PublicKey:
 
     @classmethod
     def from_signature_and_message(
-        cls, signature: bytes, message: bytes, hasher: Hasher = sha256, context: Context = GLOBAL_CONTEXT
+        cls,
+        signature: bytes | RecoverableSignature,
+        message: bytes,
+        hasher: Hasher = sha256,
+        context: Context = GLOBAL_CONTEXT,
     ) -> PublicKey:
         """
         Recovers an ECDSA public key from a recoverable signature.
 
         Parameters:
-            signature: The recoverable ECDSA signature.
+            signature: The recoverable ECDSA signature, or a parsed recoverable signature.
             message: The message that was supposedly signed.
             hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
                 return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
@@ -456,17 +849,91 @@ class PublicKey:
             ValueError: If the message hash was not 32 bytes long or recovery of the
                 ECDSA public key failed.
         """
-        return PublicKey(
-            recover(message, deserialize_recoverable(signature, context=context), hasher=hasher, context=context)
-        )
+        if isinstance(signature, RecoverableSignature):
+            recover_sig = signature.signature
+        else:
+            recover_sig = deserialize_recoverable(signature, context=context)
+
+        return PublicKey(recover(message, recover_sig, hasher=hasher, context=context))
+
+    @classmethod
+    def recover_batch(
+        cls,
+        signatures: bytes,
+        msg_hashes: bytes,
+        compressed: bool = True,  # noqa: FBT001, FBT002
+        context: Context = GLOBAL_CONTEXT,
+    ) -> tuple[bytes, list[bool]]:
+        """
+        Recovers and formats the ECDSA public keys of many recoverable signatures, without creating any key objects.
+
+        Parameters:
+            signatures: The concatenated 65-byte recoverable ECDSA signatures.
+            msg_hashes: The concatenated 32-byte hashes of the messages that were supposedly signed.
+            compressed: Whether to use the compressed format. The uncompressed format without its
+                leading byte is the input of Ethereum address derivation.
+            context: The context to use.
+
+        Returns:
+            The concatenated 33 byte formatted public keys, or the concatenated 65 byte formatted public
+            keys if `compressed` is `False`, along with a list of booleans indicating whether each public
+            key could be recovered. The public keys of entries that could not be recovered are zeroed.
+
+        Raises:
+            ValueError: If the message hashes are not all 32 bytes long or the signature
+                buffer does not match the number of message hashes.
+        """
+        msg_hashes_buffer = ffi.from_buffer(msg_hashes)
+        if len(msg_hashes_buffer) % 32:
+            msg = "Message hashes must be 32 bytes long each."
+            raise ValueError(msg)
+
+        count = len(msg_hashes_buffer) // 32
+        signatures_buffer = ffi.from_buffer("unsigned char[]", signatures)
+        if len(signatures_buffer) != 65 * count:
+            msg = "Recoverable signatures must be 65 bytes long each."
+            raise ValueError(msg)
+
+        ctx = context.ctx
+        length = 33 if compressed else 65
+        flags = EC_COMPRESSED if compressed else EC_UNCOMPRESSED
+        serialized = ffi.new("unsigned char []", length * count)
+        recover_sig = ffi.new("secp256k1_ecdsa_recoverable_signature *")
+        public_key = ffi.new("secp256k1_pubkey *")
+        output_len = ffi.new("size_t *")
+        signature_parse = lib.secp256k1_ecdsa_recoverable_signature_parse_compact
+        ecdsa_recover = lib.secp256k1_ecdsa_recover
+        pubkey_serialize = lib.secp256k1_ec_pubkey_serialize
+
+        recovered: list[bool] = []
+        append = recovered.append
+        for i in range(count):
+            signature = signatures_buffer + 65 * i
+            rec_id = signature[64]
+
+            # Recovery ids outside of the valid range must not reach the library, which treats them as API misuse
+            if (
+                rec_id <= 3  # noqa: PLR2004
+                and signature_parse(ctx, recover_sig, signature, rec_id)
+                and ecdsa_recover(ctx, public_key, recover_sig, msg_hashes_buffer + 32 * i)
+            ):
+                output_len[0] = length
+                pubkey_serialize(ctx, serialized + length * i, output_len, public_key, flags)
+                append(True)
+            else:
+                append(False)
+
+        return bytes(ffi.buffer(serialized)), recovered
 
     @classmethod
-    def combine_keys(cls, public_keys: list[PublicKey], context: Context = GLOBAL_CONTEXT) -> PublicKey:
+    def combine_keys(
+        cls, public_keys: list[PublicKey] | PublicKeyArray, context: Context = GLOBAL_CONTEXT
+    ) -> PublicKey:
         """
         Adds a number of public keys together.
 
         Parameters:
-            public_keys: A sequence of public keys.
+            public_keys: A sequence of public keys, or an array of public keys.
             context: The context to use.
 
         Returns:
@@ -477,9 +944,12 @@ class PublicKey:
         """
         public_key = ffi.new("secp256k1_pubkey *")
 
-        combined = lib.secp256k1_ec_pubkey_combine(
-            context.ctx, public_key, [pk.public_key for pk in public_keys], len(public_keys)
-        )
+        if isinstance(public_keys, PublicKeyArray):
+            pointers = [public_keys.public_keys + i for i in range(len(public_keys))]
+        else:
+            pointers = [pk.public_key for pk in public_keys]
+
+        combined = lib.secp256k1_ec_pubkey_combine(context.ctx, public_key, pointers, len(pointers))
 
         if not combined:
             msg = "The sum of the public keys is invalid."
@@ -508,6 +978,35 @@ class PublicKey:
 
         return bytes(ffi.buffer(serialized, length))
 
+    def format_into(self, out: bytearray, offset: int = 0, compressed: bool = True) -> int:  # noqa: FBT001, FBT002
+        """
+        Formats the public key directly into a preallocated buffer.
+
+        Parameters:
+            out: The writable buffer, e.g. a `bytearray` or `memoryview`, which receives the formatted public key.
+            offset: The position in the buffer at which to write the formatted public key.
+            compressed: Whether to use the compressed format.
+
+        Returns:
+            The length of the formatted public key, which is 33 bytes, or 65 bytes if `compressed` is `False`.
+
+        Raises:
+            ValueError: If the buffer did not have enough space at the offset.
+        """
+        length = 33 if compressed else 65
+        buffer = writable_buffer(out, offset, length)
+        output_len = ffi.new("size_t *", length)
+
+        lib.secp256k1_ec_pubkey_serialize(
+            self.context.ctx,
+            buffer + offset,
+            output_len,
+            self.public_key,
+            EC_COMPRESSED if compressed else EC_UNCOMPRESSED,
+        )
+
+        return length
+
     def point(self) -> tuple[int, int]:
         """
         Returns the public key as a coordinate point.
@@ -515,29 +1014,51 @@ class PublicKey:
         public_key = self.format(compressed=False)
         return bytes_to_int(public_key[1:33]), bytes_to_int(public_key[33:])
 
-    def verify(self, signature: bytes, message: bytes, hasher: Hasher = sha256) -> bool:
+    def verify(
+        self,
+        signature: bytes | EcdsaSignature,
+        message: bytes,
+        hasher: Hasher = sha256,
+        signature_cache: SignatureCache | None = None,
+        encoding: SignatureEncoding = "der",
+    ) -> bool:
         """
         Verifies an ECDSA signature.
 
         Parameters:
-            signature: The ECDSA signature.
+            signature: The ECDSA signature, or a parsed signature which is used without parsing it again.
             message: The message that was supposedly signed.
             hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
                 return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
+            signature_cache: A cache of successfully verified signatures to consult and update.
+            encoding: The encoding of the signature, either `der` or the 64 byte `compact` format.
 
         Returns:
             A boolean indicating whether the signature is correct.
 
         Raises:
-            ValueError: If the message hash was not 32 bytes long or the
-                DER-encoded signature could not be parsed.
+            ValueError: If the message hash was not 32 bytes long, the signature
+                could not be parsed, or the encoding is unknown.
         """
-        msg_hash = hasher(message) if hasher is not None else message
+        msg_hash = as_buffer(hasher(message) if hasher is not None else message)
         if len(msg_hash) != 32:  # noqa: PLR2004
             msg = "Message hash must be 32 bytes long."
             raise ValueError(msg)
 
-        verified = lib.secp256k1_ecdsa_verify(self.context.ctx, der_to_cdata(signature), msg_hash, self.public_key)
+        if isinstance(signature, EcdsaSignature):
+            sig = signature.signature
+        else:
+            sig = deserialize_signature(signature, encoding, self.context)
+
+        if signature_cache is not None:
+            cache_key = signature_cache.key(b"ecdsa", ffi.buffer(self.public_key), ffi.buffer(sig), msg_hash)
+            if signature_cache.contains(cache_key):
+                return True
+
+        verified = lib.secp256k1_ecdsa_verify(self.context.ctx, sig, msg_hash, self.public_key)
+
+        if verified and signature_cache is not None:
+            signature_cache.add(cache_key)
 
         # A performance hack to avoid global bool() lookup.
         return not not verified  # noqa: SIM208
@@ -632,22 +1153,253 @@ class PublicKey:
         return hash(self.format(compressed=False))
 
 
+class PublicKeyArray:
+    __slots__ = ("_index", "context", "public_keys")
+
+    def __init__(self, data: bytes | ffi.CData, key_size: int = 33, context: Context = GLOBAL_CONTEXT):
+        """
+        Initializes an array of public keys stored contiguously in a single allocation.
+
+        Parameters:
+            data (bytes): The concatenated formatted public keys, each of which must be `key_size` bytes long,
+                in any C-contiguous object supporting the buffer protocol.
+                Compressed (33 bytes), uncompressed (65 bytes), or hybrid (65 bytes) format public keys
+                are supported.
+            key_size: The size of each formatted public key.
+            context: The context to use.
+
+        Raises:
+            ValueError: If the data is not a whole number of formatted public keys or a
+                public key could not be parsed or was invalid.
+        """
+        if isinstance(data, ffi.CData):
+            self.public_keys = data
+        else:
+            buffer = ffi.from_buffer(data)
+            if key_size not in {33, 65} or len(buffer) % key_size:
+                msg = "The data must consist of public keys that are all either 33 or 65 bytes long."
+                raise ValueError(msg)
+
+            count = len(buffer) // key_size
+            public_keys = ffi.new("secp256k1_pubkey[]", count)
+            pubkey_parse = lib.secp256k1_ec_pubkey_parse
+
+            for i in range(count):
+                if not pubkey_parse(context.ctx, public_keys + i, buffer + i * key_size, key_size):
+                    msg = f"The public key at index {i} could not be parsed or is invalid."
+                    raise ValueError(msg)
+
+            self.public_keys = public_keys
+
+        self.context = context
+        self._index: tuple[bytes, array[int]] | None = None
+
+    @classmethod
+    def from_public_keys(cls, public_keys: Sequence[PublicKey], context: Context = GLOBAL_CONTEXT) -> PublicKeyArray:
+        """
+        Creates an array from a number of public keys.
+
+        Parameters:
+            public_keys: A sequence of public keys.
+            context: The context to use.
+
+        Returns:
+            The array of public keys.
+        """
+        return cls(ffi.new("secp256k1_pubkey[]", [pk.public_key[0] for pk in public_keys]), context=context)
+
+    def format(self, compressed: bool = True) -> bytes:  # noqa: FBT001, FBT002
+        """
+        Formats all public keys into a single buffer.
+
+        Parameters:
+            compressed: Whether to use the compressed format.
+
+        Returns:
+            The concatenated 33 byte formatted public keys, or the concatenated 65 byte
+            formatted public keys if `compressed` is `False`.
+        """
+        length = 33 if compressed else 65
+        count = len(self.public_keys)
+        serialized = ffi.new("unsigned char []", length * count)
+        output_len = ffi.new("size_t *")
+        flags = EC_COMPRESSED if compressed else EC_UNCOMPRESSED
+        ctx = self.context.ctx
+        pubkey_serialize = lib.secp256k1_ec_pubkey_serialize
+
+        for i in range(count):
+            output_len[0] = length
+            pubkey_serialize(ctx, serialized + i * length, output_len, self.public_keys + i, flags)
+
+        return bytes(ffi.buffer(serialized, length * count))
+
+    def format_into(self, out: bytearray, offset: int = 0, compressed: bool = True) -> int:  # noqa: FBT001, FBT002
+        """
+        Formats all public keys directly into a preallocated buffer.
+
+        Parameters:
+            out: The writable buffer, e.g. a `bytearray` or `memoryview`, which receives the formatted public keys.
+            offset: The position in the buffer at which to write the first formatted public key.
+            compressed: Whether to use the compressed format.
+
+        Returns:
+            The total length of the concatenated formatted public keys, which are 33 bytes each,
+            or 65 bytes each if `compressed` is `False`.
+
+        Raises:
+            ValueError: If the buffer did not have enough space at the offset.
+        """
+        length = 33 if compressed else 65
+        count = len(self.public_keys)
+        buffer = writable_buffer(out, offset, length * count)
+        serialized = buffer + offset
+        output_len = ffi.new("size_t *")
+        flags = EC_COMPRESSED if compressed else EC_UNCOMPRESSED
+        ctx = self.context.ctx
+        pubkey_serialize = lib.secp256k1_ec_pubkey_serialize
+
+        for i in range(count):
+            output_len[0] = length
+            pubkey_serialize(ctx, serialized + i * length, output_len, self.public_keys + i, flags)
+
+        return length * count
+
+    def index(self, public_key: PublicKey | bytes) -> int:
+        """
+        Finds the position of a public key in the array.
+
+        Parameters:
+            public_key: The public key, or the formatted public key.
+
+        Returns:
+            The position of the first occurrence of the public key.
+
+        Raises:
+            ValueError: If the public key is not in the array or could not be parsed.
+        """
+        if self._index is None:
+            # The positions are sorted by the formatted public keys, which are kept in a single buffer
+            # rather than as one object per key. Sorting is stable so duplicates remain in order.
+            serialized = self.format()
+            positions = array(
+                "Q", sorted(range(len(self.public_keys)), key=lambda i: serialized[i * 33 : (i + 1) * 33])
+            )
+            self._index = serialized, positions
+
+        if not isinstance(public_key, PublicKey):
+            public_key = PublicKey(public_key, self.context)
+
+        serialized, positions = self._index
+        target = public_key.format()
+        low = bisect_left(positions, target, key=lambda i: serialized[i * 33 : (i + 1) * 33])
+        if low < len(positions):
+            position = positions[low]
+            if serialized[position * 33 : (position + 1) * 33] == target:
+                return position
+
+        msg = "The public key is not in the array."
+        raise ValueError(msg)
+
+    def verify_batch(
+        self,
+        signatures: Sequence[bytes],
+        messages: Sequence[bytes],
+        hasher: Hasher = sha256,
+        encoding: SignatureEncoding = "der",
+    ) -> list[bool]:
+        """
+        Verifies ECDSA signatures against the public keys at the same positions.
+
+        Parameters:
+            signatures: The ECDSA signatures, one per public key.
+            messages: The messages that were supposedly signed, one per public key.
+            hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
+                return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
+            encoding: The encoding of the signatures, either `der` or the 64 byte `compact` format.
+
+        Returns:
+            A list of booleans indicating whether each signature is correct. Entries whose
+            signature could not be parsed are reported as incorrect.
+
+        Raises:
+            ValueError: If the number of signatures, messages, and public keys differ, a
+                message hash was not 32 bytes long, or the encoding is unknown.
+        """
+        count = len(self.public_keys)
+        if len(signatures) != count or len(messages) != count:
+            msg = "The number of signatures, messages, and public keys must be equal."
+            raise ValueError(msg)
+
+        ctx = self.context.ctx
+        public_keys = self.public_keys
+        sig = ffi.new("secp256k1_ecdsa_signature *")
+        signature_parse = signature_parser(encoding)
+        ecdsa_verify = lib.secp256k1_ecdsa_verify
+
+        results: list[bool] = []
+        append = results.append
+        for i, (signature, message) in enumerate(zip(map(as_buffer, signatures), messages, strict=True)):
+            msg_hash = as_buffer(hasher(message) if hasher is not None else message)
+            if len(msg_hash) != 32:  # noqa: PLR2004
+                msg = "Message hash must be 32 bytes long."
+                raise ValueError(msg)
+
+            append(
+                not not (  # noqa: SIM208
+                    signature_parse(ctx, sig, signature, len(signature))
+                    and ecdsa_verify(ctx, sig, msg_hash, public_keys + i)
+                )
+            )
+
+        return results
+
+    def __getitem__(self, index: int) -> PublicKey:
+        if not isinstance(index, int):
+            msg = f"Public key array indices must be integers, not {type(index).__name__}."
+            raise TypeError(msg)
+
+        if index < 0:
+            index += len(self.public_keys)
+
+        return PublicKey(ffi.new("secp256k1_pubkey *", self.public_keys[index]), self.context)
+
+    def __len__(self) -> int:
+        return len(self.public_keys)
+
+    def __contains__(self, public_key: PublicKey | bytes) -> bool:
+        try:
+            self.index(public_key)
+        except ValueError:
+            return False
+
+        return True
+
+
 class PublicKeyXOnly:
+    __slots__ = ("__weakref__", "context", "parity", "public_key")
+
     def __init__(self, data: bytes | ffi.CData, parity: bool = False, context: Context = GLOBAL_CONTEXT):  # noqa: FBT001, FBT002
         """
         Initializes a BIP340 `x-only` public key.
 
         Parameters:
-            data (bytes): The formatted public key.
+            data (bytes): The formatted public key, which may be any C-contiguous object supporting the
+                buffer protocol, e.g. a `bytearray` or `memoryview`.
             parity: Whether the encoded point is the negation of the public key.
             context: The context to use.
 
         Raises:
-            ValueError: If the public key could not be parsed or is invalid.
+            ValueError: If the public key was not 32 bytes long, could not be parsed, or is invalid.
         """
-        if not isinstance(data, bytes):
+        if isinstance(data, ffi.CData):
             self.public_key = data
         else:
+            # libsecp256k1 always reads 32 bytes so the length must be checked for every input
+            data = as_buffer(data)
+            if len(data) != KEY_SIZE:
+                msg = "The public key must be 32 bytes long."
+                raise ValueError(msg)
+
             public_key = ffi.new("secp256k1_xonly_pubkey *")
             parsed = lib.secp256k1_xonly_pubkey_parse(context.ctx, public_key, data)
             if not parsed:
@@ -680,11 +1432,7 @@ class PublicKeyXOnly:
             msg = "Secret was invalid"
             raise ValueError(msg)
 
-        xonly_pubkey = ffi.new("secp256k1_xonly_pubkey *")
-        pk_parity = ffi.new("int *")
-        res = lib.secp256k1_keypair_xonly_pub(context.ctx, xonly_pubkey, pk_parity, keypair)
-
-        return cls(xonly_pubkey, parity=not not pk_parity[0], context=context)  # noqa: SIM208
+        return cls._from_keypair(keypair, context)
 
     @classmethod
     def from_valid_secret(cls, secret: bytes, context: Context = GLOBAL_CONTEXT) -> PublicKeyXOnly:
@@ -699,17 +1447,66 @@ class PublicKeyXOnly:
             The x-only public key.
 
         Raises:
-            ValueError: If the secret was invalid.
+            ValueError: If the secret was not 32 bytes long or was invalid.
         """
+        # libsecp256k1 always reads 32 bytes so the length must be checked for every input
+        secret = as_buffer(secret)
+        if len(secret) != KEY_SIZE:
+            msg = "Secret must be 32 bytes long."
+            raise ValueError(msg)
+
         keypair = ffi.new("secp256k1_keypair *")
         res = lib.secp256k1_keypair_create(context.ctx, keypair, secret)
         if not res:
             msg = "Secret was invalid"
             raise ValueError(msg)
 
+        return cls._from_keypair(keypair, context)
+
+    @classmethod
+    def from_secrets(cls, secrets: bytes, context: Context = GLOBAL_CONTEXT) -> bytes:
+        """
+        Derives and serializes the x-only public keys of many private key secrets, without creating any key objects.
+
+        Parameters:
+            secrets: The concatenated 32 byte private key secrets.
+            context: The context to use.
+
+        Returns:
+            The concatenated 32 byte serialized public keys.
+
+        Raises:
+            ValueError: If the secrets are not all 32 bytes long or a secret was invalid.
+        """
+        secrets_buffer = ffi.from_buffer(secrets)
+        if len(secrets_buffer) % 32:
+            msg = "Secrets must be 32 bytes long each."
+            raise ValueError(msg)
+
+        ctx = context.ctx
+        count = len(secrets_buffer) // 32
+        serialized = ffi.new("unsigned char []", 32 * count)
+        public_key = ffi.new("secp256k1_pubkey *")
+        xonly_pubkey = ffi.new("secp256k1_xonly_pubkey *")
+        pubkey_create = lib.secp256k1_ec_pubkey_create
+        xonly_pubkey_from_pubkey = lib.secp256k1_xonly_pubkey_from_pubkey
+        xonly_pubkey_serialize = lib.secp256k1_xonly_pubkey_serialize
+
+        for i in range(count):
+            if not pubkey_create(ctx, public_key, secrets_buffer + 32 * i):
+                msg = f"The secret at index {i} is invalid."
+                raise ValueError(msg)
+
+            xonly_pubkey_from_pubkey(ctx, xonly_pubkey, ffi.NULL, public_key)
+            xonly_pubkey_serialize(ctx, serialized + 32 * i, xonly_pubkey)
+
+        return bytes(ffi.buffer(serialized))
+
+    @classmethod
+    def _from_keypair(cls, keypair: ffi.CData, context: Context = GLOBAL_CONTEXT) -> PublicKeyXOnly:
         xonly_pubkey = ffi.new("secp256k1_xonly_pubkey *")
         pk_parity = ffi.new("int *")
-        res = lib.secp256k1_keypair_xonly_pub(context.ctx, xonly_pubkey, pk_parity, keypair)
+        lib.secp256k1_keypair_xonly_pub(context.ctx, xonly_pubkey, pk_parity, keypair)
 
         return cls(xonly_pubkey, parity=not not pk_parity[0], context=context)  # noqa: SIM208
 
@@ -732,13 +1529,38 @@ class PublicKeyXOnly:
 
         return bytes(ffi.buffer(output32, 32))
 
-    def verify(self, signature: bytes, message: bytes) -> bool:
+    def format_into(self, out: bytearray, offset: int = 0) -> int:
+        """
+        Serializes the public key directly into a preallocated buffer.
+
+        Parameters:
+            out: The writable buffer, e.g. a `bytearray` or `memoryview`, which receives the serialized public key.
+            offset: The position in the buffer at which to write the serialized public key.
+
+        Returns:
+            The length of the serialized public key, which is always 32 bytes.
+
+        Raises:
+            ValueError: If the public key in `self.public_key` is invalid or the
+                buffer did not have enough space at the offset.
+        """
+        buffer = writable_buffer(out, offset, 32)
+
+        res = lib.secp256k1_xonly_pubkey_serialize(self.context.ctx, buffer + offset, self.public_key)
+        if not res:
+            msg = "Public key in self.public_key must be valid"
+            raise ValueError(msg)
+
+        return 32
+
+    def verify(self, signature: bytes, message: bytes, signature_cache: SignatureCache | None = None) -> bool:
         """
         Verifies a Schnorr signature over a given message.
 
         Parameters:
             signature: The 64-byte Schnorr signature to verify.
             message: The message to be verified.
+            signature_cache: A cache of successfully verified signatures to consult and update.
 
         Returns:
             A boolean indicating whether the signature is correct.
@@ -746,13 +1568,73 @@ class PublicKeyXOnly:
         Raises:
             ValueError: If the signature is not 64 bytes long.
         """
+        signature = as_buffer(signature)
         if len(signature) != 64:  # noqa: PLR2004
             msg = "Signature must be 64 bytes long."
             raise ValueError(msg)
 
-        return not not lib.secp256k1_schnorrsig_verify(  # noqa: SIM208
-            self.context.ctx, signature, message, len(message), self.public_key
-        )
+        message = as_buffer(message)
+        if signature_cache is not None:
+            cache_key = signature_cache.key(b"schnorr", ffi.buffer(self.public_key), signature, message)
+            if signature_cache.contains(cache_key):
+                return True
+
+        verified = lib.secp256k1_schnorrsig_verify(self.context.ctx, signature, message, len(message), self.public_key)
+
+        if verified and signature_cache is not None:
+            signature_cache.add(cache_key)
+
+        return not not verified  # noqa: SIM208
+
+    @classmethod
+    def verify_batch(
+        cls, signatures: bytes, messages: Sequence[bytes], public_keys: bytes, context: Context = GLOBAL_CONTEXT
+    ) -> list[bool]:
+        """
+        Verifies many Schnorr signatures at once.
+
+        The signatures and public keys are read in place from contiguous buffers and a single
+        parsed public key structure is reused for every entry.
+
+        Parameters:
+            signatures: The concatenated 64-byte Schnorr signatures.
+            messages: The messages to be verified, one per signature.
+            public_keys: The concatenated 32-byte x-only public keys, one per signature.
+            context: The context to use.
+
+        Returns:
+            A list of booleans indicating whether each signature is correct. Entries whose
+            public key could not be parsed are reported as incorrect.
+
+        Raises:
+            ValueError: If the signature or public key buffers do not match the number of messages.
+        """
+        count = len(messages)
+        signatures_buffer = ffi.from_buffer(signatures)
+        if len(signatures_buffer) != 64 * count:
+            msg = "Signatures must be 64 bytes long each."
+            raise ValueError(msg)
+        public_keys_buffer = ffi.from_buffer(public_keys)
+        if len(public_keys_buffer) != 32 * count:
+            msg = "Public keys must be 32 bytes long each."
+            raise ValueError(msg)
+
+        ctx = context.ctx
+        public_key = ffi.new("secp256k1_xonly_pubkey *")
+        xonly_pubkey_parse = lib.secp256k1_xonly_pubkey_parse
+        schnorrsig_verify = lib.secp256k1_schnorrsig_verify
+
+        results: list[bool] = []
+        append = results.append
+        for i, message in enumerate(map(as_buffer, messages)):
+            append(
+                not not (  # noqa: SIM208
+                    xonly_pubkey_parse(ctx, public_key, public_keys_buffer + 32 * i)
+                    and schnorrsig_verify(ctx, signatures_buffer + 64 * i, message, len(message), public_key)
+                )
+            )
+
+        return results
 
     def tweak_add(self, scalar: bytes) -> None:
         """
@@ -785,3 +1667,179 @@ class PublicKeyXOnly:
 
     def __hash__(self) -> int:
         return hash(self.format())
+
+
+class EcdsaSignature:
+    __slots__ = ("context", "signature")
+
+    def __init__(self, data: bytes | ffi.CData, encoding: SignatureEncoding = "der", context: Context = GLOBAL_CONTEXT):
+        """
+        Parses an ECDSA signature once so that it can be verified against many public keys or
+        re-encoded without parsing it again.
+
+        Parameters:
+            data: The encoded signature, or an already parsed `secp256k1_ecdsa_signature` structure.
+            encoding: The encoding of the signature, either `der` or the 64 byte `compact` format.
+            context: The context to use.
+
+        Raises:
+            ValueError: If the signature could not be parsed or the encoding is unknown.
+        """
+        self.signature = data if isinstance(data, ffi.CData) else deserialize_signature(data, encoding, context)
+        self.context = context
+
+    @classmethod
+    def from_der(cls, der: bytes, context: Context = GLOBAL_CONTEXT) -> EcdsaSignature:
+        """
+        Parses a DER-encoded ECDSA signature.
+
+        Parameters:
+            der: The DER-encoded signature.
+            context: The context to use.
+
+        Returns:
+            The signature.
+
+        Raises:
+            ValueError: If the signature could not be parsed.
+        """
+        return EcdsaSignature(der, "der", context)
+
+    @classmethod
+    def from_compact(cls, compact: bytes, context: Context = GLOBAL_CONTEXT) -> EcdsaSignature:
+        """
+        Parses a 64 byte compact ECDSA signature.
+
+        Parameters:
+            compact: The compact signature.
+            context: The context to use.
+
+        Returns:
+            The signature.
+
+        Raises:
+            ValueError: If the signature could not be parsed.
+        """
+        return EcdsaSignature(compact, "compact", context)
+
+    @property
+    def is_normalized(self) -> bool:
+        """
+        Whether the signature is in the lower-S form, which is the only form accepted by verification.
+        """
+        return not signature_normalize(self.signature, self.context)[0]
+
+    def normalize(self) -> EcdsaSignature:
+        """
+        Converts the signature to the lower-S form.
+
+        Returns:
+            The normalized signature, which is this signature if it was already normalized.
+        """
+        normalized, signature = signature_normalize(self.signature, self.context)
+        return EcdsaSignature(signature, context=self.context) if normalized else self
+
+    def to_der(self) -> bytes:
+        """
+        Returns:
+            The DER-encoded signature.
+        """
+        return serialize_signature(self.signature, "der", self.context)
+
+    def to_compact(self) -> bytes:
+        """
+        Returns:
+            The 64 byte compact signature.
+        """
+        return serialize_signature(self.signature, "compact", self.context)
+
+    def __eq__(self, other) -> bool:
+        return self.to_compact() == other.to_compact()
+
+    def __hash__(self) -> int:
+        return hash(self.to_compact())
+
+
+class RecoverableSignature:
+    __slots__ = ("context", "signature")
+
+    def __init__(self, data: bytes | ffi.CData, context: Context = GLOBAL_CONTEXT):
+        """
+        Parses a recoverable ECDSA signature once.
+
+        Parameters:
+            data: The 65 byte recoverable signature, or an already parsed
+                `secp256k1_ecdsa_recoverable_signature` structure.
+            context: The context to use.
+
+        Raises:
+            ValueError: If the signature was not 65 bytes long, the recovery id was invalid,
+                or the signature could not be parsed.
+        """
+        self.signature = data if isinstance(data, ffi.CData) else deserialize_recoverable(data, context)
+        self.context = context
+
+    @classmethod
+    def from_bytes(cls, data: bytes, context: Context = GLOBAL_CONTEXT) -> RecoverableSignature:
+        """
+        Parses a recoverable ECDSA signature.
+
+        Parameters:
+            data: The 65 byte recoverable signature.
+            context: The context to use.
+
+        Returns:
+            The signature.
+
+        Raises:
+            ValueError: If the signature was not 65 bytes long, the recovery id was invalid,
+                or the signature could not be parsed.
+        """
+        return RecoverableSignature(data, context)
+
+    @property
+    def recid(self) -> int:
+        """
+        The recovery id, from 0 to 3.
+        """
+        return self.to_bytes()[CDATA_SIG_LENGTH]
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns:
+            The 65 byte recoverable signature.
+        """
+        return serialize_recoverable(self.signature, self.context)
+
+    def to_ecdsa(self) -> EcdsaSignature:
+        """
+        Converts the signature to a regular ECDSA signature, discarding the recovery id.
+
+        Returns:
+            The ECDSA signature.
+        """
+        return EcdsaSignature(recoverable_convert(self.signature, self.context), context=self.context)
+
+    def recover(self, message: bytes, hasher: Hasher = sha256) -> PublicKey:
+        """
+        Recovers the public key that created the signature.
+
+        Parameters:
+            message: The message that was supposedly signed.
+            hasher (collections.abc.Callable[[bytes], bytes] | None): The hash function to use, which must
+                return 32 bytes. By default, the `sha256` algorithm is used. If `None`, no hashing occurs.
+
+        Returns:
+            The public key that signed the message.
+
+        Raises:
+            ValueError: If the message hash was not 32 bytes long or recovery of the
+                ECDSA public key failed.
+        """
+        return PublicKey(recover(message, self.signature, hasher, self.context), self.context)
+
+    def __eq__(self, other) -> bool:
+        return self.to_bytes() == other.to_bytes()
+
+    def __hash__(self) -> int:
+        return hash(self.to_bytes())
@@ -0,0 +1,335 @@
+"""
+Storage of large numbers of private keys.
+
+PEM bundles are processed one line at a time so memory usage does not depend on the size of the bundle.
+Binary keystores store fixed-width keys that are memory-mapped rather than read, so opening one is
+nearly instant regardless of its size and processes that open the same file share its pages.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from base64 import b64decode
+from typing import TYPE_CHECKING
+
+from coincurve.context import GLOBAL_CONTEXT, Context
+from coincurve.der import decode_der
+from coincurve.keys import PrivateKey, PublicKey
+from coincurve.utils import KEY_SIZE, PEM_FOOTER, PEM_HEADER
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+    from typing import BinaryIO
+
+PEM_BEGIN = PEM_HEADER.strip()
+PEM_END = PEM_FOOTER.strip()
+PEM_BOUNDARY = b"-----BEGIN "
+
+# Binary keystore layout, all integers are little-endian:
+#
+#     magic (4 bytes) | version (2 bytes) | flags (2 bytes) | count (8 bytes)
+#     secrets (32 bytes each)
+#     compressed public keys (33 bytes each)
+#     index (8 bytes each, optional): the positions of the keys sorted by public key
+KEYSTORE_HEADER = struct.Struct("<4sHHQ")
+KEYSTORE_MAGIC = b"CCKS"
+KEYSTORE_VERSION = 1
+KEYSTORE_FLAG_INDEX = 0x01
+PUBLIC_KEY_SIZE = 33
+INDEX_ENTRY = struct.Struct("<Q")
+INDEX_TYPECODE = "Q"
+
+
+def iter_pem_private_keys(fileobj: BinaryIO, context: Context = GLOBAL_CONTEXT) -> Iterator[PrivateKey]:
+    """
+    Reads concatenated PEM-encoded private keys, yielding each key as soon as its block has been read.
+
+    Text outside of the blocks, such as blank lines or comments, is ignored.
+
+    Parameters:
+        fileobj: The binary file object from which to read.
+        context: The context to use.
+
+    Returns:
+        An iterator over the private keys.
+
+    Raises:
+        ValueError: If a block is not a PKCS#8 private key, a private key could not be decoded,
+            or the data ends inside a block.
+    """
+    lines: list[bytes] | None = None
+    for raw_line in fileobj:
+        line = raw_line.strip()
+        if lines is None:
+            if line == PEM_BEGIN:
+                lines = []
+            elif line.startswith(PEM_BOUNDARY):
+                msg = "Only PEM blocks containing PKCS#8 private keys are supported."
+                raise ValueError(msg)
+        elif line == PEM_END:
+            yield PrivateKey(decode_der(b64decode(b"".join(lines))), context)
+            lines = None
+        else:
+            lines.append(line)
+
+    if lines is not None:
+        msg = "The PEM data ends inside a private key block."
+        raise ValueError(msg)
+
+
+def write_pem_private_keys(fileobj: BinaryIO, keys: Iterable[PrivateKey]) -> int:
+    """
+    Writes private keys as concatenated PEM blocks, encoding each key only when it is written.
+
+    Parameters:
+        fileobj: The binary file object to which to write.
+        keys: The private keys.
+
+    Returns:
+        The number of private keys written.
+    """
+    write = fileobj.write
+    count = 0
+    for key in keys:
+        write(key.to_pem())
+        count += 1
+
+    return count
+
+
+class KeyStore:
+    __slots__ = ("_index_offset", "_mmap", "_view", "context", "count")
+
+    def __init__(self, data: mmap.mmap, context: Context = GLOBAL_CONTEXT):
+        """
+        Initializes a keystore over the contents of a binary keystore file. Use
+        [open][coincurve.keystore.KeyStore.open] to open a file.
+
+        Parameters:
+            data: The mapped contents of the file.
+            context: The context to use.
+
+        Raises:
+            ValueError: If the data is not a valid keystore.
+        """
+        if len(data) < KEYSTORE_HEADER.size:
+            msg = "Invalid keystore: missing header"
+            raise ValueError(msg)
+
+        magic, version, flags, count = KEYSTORE_HEADER.unpack_from(data)
+        if magic != KEYSTORE_MAGIC or version != KEYSTORE_VERSION:
+            msg = "Invalid keystore: unsupported format"
+            raise ValueError(msg)
+
+        index_offset = KEYSTORE_HEADER.size + (KEY_SIZE + PUBLIC_KEY_SIZE) * count
+        size = index_offset + INDEX_ENTRY.size * count if flags & KEYSTORE_FLAG_INDEX else index_offset
+        if len(data) != size:
+            msg = "Invalid keystore: unexpected size"
+            raise ValueError(msg)
+
+        self._mmap = data
+        self._view = memoryview(data)
+        self._index_offset = index_offset if flags & KEYSTORE_FLAG_INDEX else None
+        self.context = context
+        self.count: int = count
+
+    @classmethod
+    def create(
+        cls,
+        path: str | os.PathLike,
+        secrets: bytes,
+        index: bool = True,  # noqa: FBT001, FBT002
+        context: Context = GLOBAL_CONTEXT,
+    ) -> KeyStore:
+        """
+        Writes private key secrets and their compressed public keys to a binary keystore file and opens it.
+
+        Parameters:
+            path: The path of the file, which is overwritten if it exists.
+            secrets: The concatenated 32 byte private key secrets.
+            index: Whether to store an index for looking up keys by their public key.
+            context: The context to use.
+
+        Returns:
+            The opened keystore.
+
+        Raises:
+            ValueError: If the secrets are not all 32 bytes long or a secret was invalid.
+        """
+        public_keys = PublicKey.from_secrets(secrets, context=context)
+        count = len(public_keys) // PUBLIC_KEY_SIZE
+
+        with open(path, "wb") as f:
+            f.write(KEYSTORE_HEADER.pack(KEYSTORE_MAGIC, KEYSTORE_VERSION, KEYSTORE_FLAG_INDEX if index else 0, count))
+            f.write(secrets)
+            f.write(public_keys)
+            if index:
+                positions = array(
+                    INDEX_TYPECODE,
+                    sorted(range(count), key=lambda i: public_keys[i * PUBLIC_KEY_SIZE : (i + 1) * PUBLIC_KEY_SIZE]),
+                )
+                if sys.byteorder != "little":  # no cov
+                    positions.byteswap()
+
+                f.write(positions)
+
+        return cls.open(path, context)
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, context: Context = GLOBAL_CONTEXT) -> KeyStore:
+        """
+        Opens a binary keystore file by memory-mapping it, so keys are only read when they are accessed
+        and the pages are shared between processes that open the same file.
+
+        Parameters:
+            path: The path of the file.
+            context: The context to use.
+
+        Returns:
+            The keystore.
+
+        Raises:
+            ValueError: If the file is not a valid keystore.
+        """
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            return cls(data, context)
+        except ValueError:
+            data.close()
+            raise
+
+    @property
+    def secrets(self) -> memoryview:
+        """
+        The concatenated 32 byte private key secrets, read directly from the mapped file.
+        """
+        return self._view[KEYSTORE_HEADER.size : KEYSTORE_HEADER.size + KEY_SIZE * self.count]
+
+    @property
+    def public_keys(self) -> memoryview:
+        """
+        The concatenated 33 byte compressed public keys, read directly from the mapped file.
+        """
+        offset = KEYSTORE_HEADER.size + KEY_SIZE * self.count
+        return self._view[offset : offset + PUBLIC_KEY_SIZE * self.count]
+
+    def private_key(self, index: int) -> PrivateKey:
+        """
+        Creates the private key at a position.
+
+        Parameters:
+            index: The position of the key.
+
+        Returns:
+            The private key.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        offset = KEYSTORE_HEADER.size + KEY_SIZE * self._position(index)
+        return PrivateKey(self._mmap[offset : offset + KEY_SIZE], self.context)
+
+    def public_key(self, index: int) -> PublicKey:
+        """
+        Creates the public key at a position, parsing it directly from the mapped file.
+
+        Parameters:
+            index: The position of the key.
+
+        Returns:
+            The public key.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        offset = KEYSTORE_HEADER.size + KEY_SIZE * self.count + PUBLIC_KEY_SIZE * self._position(index)
+        return PublicKey(self._view[offset : offset + PUBLIC_KEY_SIZE], self.context)
+
+    def index(self, public_key: PublicKey | bytes) -> int:
+        """
+        Finds the position of a key by its public key, using a binary search if the keystore has an index
+        and a linear scan otherwise.
+
+        Parameters:
+            public_key: The public key, or the formatted public key.
+
+        Returns:
+            The position of the first occurrence of the public key.
+
+        Raises:
+            ValueError: If the public key is not in the keystore or could not be parsed.
+        """
+        if not isinstance(public_key, PublicKey):
+            public_key = PublicKey(public_key, self.context)
+
+        target = public_key.format()
+        data = self._mmap
+        public_keys_offset = KEYSTORE_HEADER.size + KEY_SIZE * self.count
+
+        if self._index_offset is not None:
+            index_offset = self._index_offset
+            unpack_from = INDEX_ENTRY.unpack_from
+            low, high = 0, self.count
+            while low < high:
+                middle = (low + high) // 2
+                offset = (
+                    public_keys_offset
+                    + PUBLIC_KEY_SIZE * unpack_from(data, index_offset + INDEX_ENTRY.size * middle)[0]
+                )
+                if data[offset : offset + PUBLIC_KEY_SIZE] < target:
+                    low = middle + 1
+                else:
+                    high = middle
+
+            if low < self.count:
+                position = unpack_from(data, index_offset + INDEX_ENTRY.size * low)[0]
+                offset = public_keys_offset + PUBLIC_KEY_SIZE * position
+                if data[offset : offset + PUBLIC_KEY_SIZE] == target:
+                    return position
+        else:
+            end = public_keys_offset + PUBLIC_KEY_SIZE * self.count
+            offset = data.find(target, public_keys_offset, end)
+            while offset != -1:
+                position, remainder = divmod(offset - public_keys_offset, PUBLIC_KEY_SIZE)
+                if not remainder:
+                    return position
+
+                # The match straddles two keys so the search continues from the next one
+                offset = data.find(target, public_keys_offset + PUBLIC_KEY_SIZE * (position + 1), end)
+
+        msg = "The public key is not in the keystore."
+        raise ValueError(msg)
+
+    def close(self) -> None:
+        """
+        Unmaps the file. Views of the secrets or public keys must be released beforehand.
+        """
+        self._view.release()
+        self._mmap.close()
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            msg = "The keystore index is out of range."
+            raise IndexError(msg)
+
+        return index
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> KeyStore:  # noqa: PYI034
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
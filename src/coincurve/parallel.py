@@ -0,0 +1,279 @@
+"""
+Multi-process bulk signature verification.
+
+Inputs are copied once into a `multiprocessing.shared_memory` segment which every worker attaches to,
+so no signature, message, or public key data is pickled. Each worker process creates its own context
+when it starts and writes its results directly back into the shared segment.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Final, Literal
+
+from coincurve._libsecp256k1 import ffi, lib
+from coincurve.context import Context
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+
+DEFAULT_CHUNK_SIZE = 4096
+OFFSET_TYPECODE: Final[Literal["Q"]] = "Q"
+OFFSET_SIZE = array(OFFSET_TYPECODE).itemsize
+
+_worker_context: Context | None = None
+
+
+def _initialize_worker() -> None:
+    global _worker_context  # noqa: PLW0603
+    _worker_context = Context(name="parallel worker")
+
+
+def _attach(name: str) -> SharedMemory:
+    # The segment is owned by the parent process, so it must not be tracked here. On older versions of Python
+    # tracking cannot be disabled but workers share the resource tracker of the parent so the parent's
+    # unlinking of the segment is still the only cleanup that happens.
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    return SharedMemory(name=name)
+
+
+def _offsets(items: Sequence[bytes]) -> bytes:
+    return array(OFFSET_TYPECODE, accumulate(map(len, items), initial=0)).tobytes()
+
+
+def _shared_view(shm: SharedMemory) -> memoryview:
+    view = shm.buf
+    assert view is not None  # noqa: S101
+    return view
+
+
+def _cast_offsets(view: memoryview, start: int, stop: int) -> memoryview:
+    # Only the offsets up to and including the end of the last item in the chunk are needed
+    return view[start : start + OFFSET_SIZE * (stop + 1)].cast(OFFSET_TYPECODE)
+
+
+def _verify_ecdsa_chunk(name: str, layout: dict[str, int], start: int, stop: int) -> None:
+    ctx = _worker_context.ctx  # type: ignore[union-attr]
+    shm = _attach(name)
+    view = _shared_view(shm)
+    buffer = ffi.from_buffer(view)
+    signature_offsets = public_key_offsets = None
+    try:
+        signature_offsets = _cast_offsets(view, layout["signature_offsets"], stop)
+        public_key_offsets = _cast_offsets(view, layout["public_key_offsets"], stop)
+        signatures = buffer + layout["signatures"]
+        msg_hashes = buffer + layout["msg_hashes"]
+        public_keys = buffer + layout["public_keys"]
+        results = layout["results"]
+
+        pubkey = ffi.new("secp256k1_pubkey *")
+        sig = ffi.new("secp256k1_ecdsa_signature *")
+        pubkey_parse = lib.secp256k1_ec_pubkey_parse
+        signature_parse = lib.secp256k1_ecdsa_signature_parse_der
+        ecdsa_verify = lib.secp256k1_ecdsa_verify
+
+        for i in range(start, stop):
+            signature_offset = signature_offsets[i]
+            public_key_offset = public_key_offsets[i]
+            view[results + i] = not not (  # noqa: SIM208
+                pubkey_parse(
+                    ctx, pubkey, public_keys + public_key_offset, public_key_offsets[i + 1] - public_key_offset
+                )
+                and signature_parse(
+                    ctx, sig, signatures + signature_offset, signature_offsets[i + 1] - signature_offset
+                )
+                and ecdsa_verify(ctx, sig, msg_hashes + 32 * i, pubkey)
+            )
+    finally:
+        if signature_offsets is not None:
+            signature_offsets.release()
+        if public_key_offsets is not None:
+            public_key_offsets.release()
+        ffi.release(buffer)
+        del view
+        shm.close()
+
+
+def _verify_schnorr_chunk(name: str, layout: dict[str, int], start: int, stop: int) -> None:
+    ctx = _worker_context.ctx  # type: ignore[union-attr]
+    shm = _attach(name)
+    view = _shared_view(shm)
+    buffer = ffi.from_buffer(view)
+    message_offsets = None
+    try:
+        message_offsets = _cast_offsets(view, layout["message_offsets"], stop)
+        signatures = buffer + layout["signatures"]
+        messages = buffer + layout["messages"]
+        public_keys = buffer + layout["public_keys"]
+        results = layout["results"]
+
+        public_key = ffi.new("secp256k1_xonly_pubkey *")
+        xonly_pubkey_parse = lib.secp256k1_xonly_pubkey_parse
+        schnorrsig_verify = lib.secp256k1_schnorrsig_verify
+
+        for i in range(start, stop):
+            message_offset = message_offsets[i]
+            view[results + i] = not not (  # noqa: SIM208
+                xonly_pubkey_parse(ctx, public_key, public_keys + 32 * i)
+                and schnorrsig_verify(
+                    ctx,
+                    signatures + 64 * i,
+                    messages + message_offset,
+                    message_offsets[i + 1] - message_offset,
+                    public_key,
+                )
+            )
+    finally:
+        if message_offsets is not None:
+            message_offsets.release()
+        ffi.release(buffer)
+        del view
+        shm.close()
+
+
+class VerificationPool:
+    def __init__(self, max_workers: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initializes a pool of worker processes for verifying large batches of signatures.
+
+        Parameters:
+            max_workers: The number of worker processes. By default, this is the number of CPUs.
+            chunk_size: The maximum number of signatures verified by a worker per task.
+
+        Raises:
+            ValueError: If the chunk size is less than 1.
+        """
+        if chunk_size < 1:
+            msg = "The chunk size must be at least 1."
+            raise ValueError(msg)
+
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_initialize_worker)
+
+    def verify_ecdsa(
+        self, signatures: Sequence[bytes], msg_hashes: Sequence[bytes], public_keys: Sequence[bytes]
+    ) -> list[bool]:
+        """
+        Verifies ECDSA signatures across the worker processes.
+
+        Parameters:
+            signatures: The DER-encoded ECDSA signatures.
+            msg_hashes: The 32-byte hashes of the messages that were supposedly signed.
+            public_keys: The formatted public keys.
+
+        Returns:
+            A list of booleans indicating whether each signature is correct. Entries whose
+            public key or signature could not be parsed are reported as incorrect.
+
+        Raises:
+            ValueError: If the number of signatures, message hashes, and public keys differ or a
+                message hash was not 32 bytes long.
+        """
+        count = len(signatures)
+        if len(msg_hashes) != count or len(public_keys) != count:
+            msg = "The number of signatures, message hashes, and public keys must be equal."
+            raise ValueError(msg)
+        if any(len(msg_hash) != 32 for msg_hash in msg_hashes):  # noqa: PLR2004
+            msg = "Message hash must be 32 bytes long."
+            raise ValueError(msg)
+
+        return self._run(
+            _verify_ecdsa_chunk,
+            count,
+            {
+                "signature_offsets": _offsets(signatures),
+                "public_key_offsets": _offsets(public_keys),
+                "signatures": b"".join(signatures),
+                "msg_hashes": b"".join(msg_hashes),
+                "public_keys": b"".join(public_keys),
+            },
+        )
+
+    def verify_schnorr(self, signatures: bytes, messages: Sequence[bytes], public_keys: bytes) -> list[bool]:
+        """
+        Verifies Schnorr signatures across the worker processes.
+
+        Parameters:
+            signatures: The concatenated 64-byte Schnorr signatures.
+            messages: The messages to be verified, one per signature.
+            public_keys: The concatenated 32-byte x-only public keys, one per signature.
+
+        Returns:
+            A list of booleans indicating whether each signature is correct. Entries whose
+            public key could not be parsed are reported as incorrect.
+
+        Raises:
+            ValueError: If the signature or public key buffers do not match the number of messages.
+        """
+        count = len(messages)
+        if len(signatures) != 64 * count:
+            msg = "Signatures must be 64 bytes long each."
+            raise ValueError(msg)
+        if len(public_keys) != 32 * count:
+            msg = "Public keys must be 32 bytes long each."
+            raise ValueError(msg)
+
+        return self._run(
+            _verify_schnorr_chunk,
+            count,
+            {
+                "message_offsets": _offsets(messages),
+                "signatures": signatures,
+                "messages": b"".join(messages),
+                "public_keys": public_keys,
+            },
+        )
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        self._executor.shutdown()
+
+    def _run(self, func, count: int, segments: dict[str, bytes]) -> list[bool]:
+        if not count:
+            return []
+
+        # Offsets come first to keep them aligned for casting
+        layout = {}
+        size = 0
+        for key, data in segments.items():
+            layout[key] = size
+            size += len(data)
+        layout["results"] = size
+
+        shm = SharedMemory(create=True, size=size + count)
+        try:
+            view = _shared_view(shm)
+            for key, data in segments.items():
+                view[layout[key] : layout[key] + len(data)] = data
+
+            futures = [
+                self._executor.submit(func, shm.name, layout, start, min(start + self.chunk_size, count))
+                for start in range(0, count, self.chunk_size)
+            ]
+            for future in futures:
+                future.result()
+
+            results = [not not result for result in view[size : size + count]]  # noqa: SIM208
+            del view
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return results
+
+    def __enter__(self) -> VerificationPool:  # noqa: PYI034
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.shutdown()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import Literal
 
 from coincurve._libsecp256k1 import ffi
 
 Hasher = Callable[[bytes], bytes] | None
 Nonce = tuple[ffi.CData, ffi.CData]
+EcdhHash = tuple[ffi.CData, ffi.CData]
+SignatureEncoding = Literal["der", "compact"]
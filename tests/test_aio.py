@@ -0,0 +1,122 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from os import urandom
+
+import pytest
+
+from coincurve.aio import Signer, Verifier
+from coincurve.keys import PrivateKey
+from coincurve.utils import verify_signature
+
+
+class TestVerifier:
+    def test_verify(self, samples):
+        verifier = Verifier()
+
+        async def main():
+            return await asyncio.gather(
+                verifier.verify(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"]),
+                verifier.verify(samples["SIGNATURE"], b"", samples["PUBLIC_KEY_COMPRESSED"]),
+                verifier.verify(b"\x00", samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"]),
+            )
+
+        assert asyncio.run(main()) == [True, False, False]
+
+    def test_verify_many(self, samples):
+        private_key = PrivateKey()
+        messages = [urandom(64) for _ in range(10)]
+        signatures = [private_key.sign(message) for message in messages]
+        public_keys = [private_key.public_key.format()] * 9 + [samples["PUBLIC_KEY_COMPRESSED"]]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            verifier = Verifier(max_batch_size=3, executor=executor)
+            assert asyncio.run(verifier.verify_many(signatures, messages, public_keys)) == [True] * 9 + [False]
+
+    def test_latency_flush(self, samples):
+        verifier = Verifier(max_batch_size=1000, max_latency=0)
+
+        async def main():
+            return await verifier.verify(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"])
+
+        assert asyncio.run(main())
+
+    def test_cancelled_requests(self, samples):
+        verifier = Verifier(max_latency=0.05)
+
+        async def main():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    verifier.verify(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"]), 0.001
+                )
+
+            assert len(verifier._batcher._items) == 1  # noqa: SLF001
+
+        # The pending batch of a closed loop must not block requests made from another loop
+        asyncio.run(main())
+        asyncio.run(main())
+
+        async def verify():
+            return await asyncio.wait_for(
+                verifier.verify(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"]), 1
+            )
+
+        assert asyncio.run(verify())
+        assert verifier._batcher._items == []  # noqa: SLF001
+
+        async def cancel_then_verify():
+            request = asyncio.ensure_future(
+                verifier.verify(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"])
+            )
+            await asyncio.sleep(0)
+            request.cancel()
+            await asyncio.sleep(0.1)
+
+            return await asyncio.gather(
+                verifier.verify(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"]),
+                verifier.verify(samples["SIGNATURE"], b"", samples["PUBLIC_KEY_COMPRESSED"]),
+            )
+
+        assert asyncio.run(cancel_then_verify()) == [True, False]
+
+    def test_invalid_message_hash(self, samples):
+        verifier = Verifier(hasher=None)
+
+        with pytest.raises(ValueError, match=r"Message hash must be 32 bytes long\."):
+            asyncio.run(verifier.verify(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"]))
+
+    def test_length_mismatch(self, samples):
+        verifier = Verifier()
+
+        with pytest.raises(ValueError, match=r"The number of signatures, messages, and public keys must be equal\."):
+            asyncio.run(verifier.verify_many([samples["SIGNATURE"]], [], [samples["PUBLIC_KEY_COMPRESSED"]]))
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError, match=r"The maximum batch size must be at least 1\."):
+            Verifier(max_batch_size=0)
+
+        with pytest.raises(ValueError, match=r"The maximum latency must not be negative\."):
+            Verifier(max_latency=-1)
+
+
+class TestSigner:
+    def test_sign(self, samples):
+        signer = Signer(PrivateKey(samples["PRIVATE_KEY_BYTES"]))
+
+        assert asyncio.run(signer.sign(samples["MESSAGE"])) == samples["SIGNATURE"]
+
+    def test_sign_many(self):
+        private_key = PrivateKey()
+        signer = Signer(private_key, max_batch_size=4)
+        messages = [urandom(64) for _ in range(10)]
+
+        signatures = asyncio.run(signer.sign_many(messages))
+
+        assert len(signatures) == 10
+        for signature, message in zip(signatures, messages, strict=True):
+            assert verify_signature(signature, message, private_key.public_key.format())
+
+    def test_sign_error(self):
+        signer = Signer(PrivateKey(), hasher=None)
+
+        with pytest.raises(ValueError, match=r"Message hash must be 32 bytes long\."):
+            asyncio.run(signer.sign_many([urandom(32), urandom(31)]))
@@ -0,0 +1,148 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import urandom
+
+import pytest
+
+from coincurve.cache import PublicKeyCache, SignatureCache
+from coincurve.keys import PrivateKey, PublicKey
+from coincurve.utils import verify_signature
+
+
+class TestSignatureCache:
+    def test_lru_eviction(self):
+        cache = SignatureCache(max_entries=2)
+        a, b, c = (cache.key(part) for part in (b"a", b"b", b"c"))
+
+        cache.add(a)
+        cache.add(b)
+        assert cache.contains(a)
+        cache.add(c)
+
+        assert len(cache) == 2
+        assert cache.contains(a)
+        assert cache.contains(c)
+        assert not cache.contains(b)
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_key(self):
+        cache = SignatureCache()
+
+        assert len(cache.key(b"a", b"bc")) == 32
+        assert cache.key(b"a", b"bc") != cache.key(b"ab", b"c")
+        assert cache.key(b"a") != SignatureCache().key(b"a")
+        assert SignatureCache(salt=b"salt").key(b"a") == SignatureCache(salt=b"salt").key(b"a")
+
+    def test_clear(self):
+        cache = SignatureCache()
+        key = cache.key(b"a")
+        cache.add(key)
+        cache.contains(key)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_thread_safety(self):
+        cache = SignatureCache(max_entries=100)
+
+        def work(i):
+            key = cache.key(i.to_bytes(2, "big"))
+            cache.add(key)
+            cache.contains(key)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(1000)))
+
+        assert len(cache) == 100
+        assert cache.hits + cache.misses == 1000
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match=r"The cache must be able to hold at least one entry\."):
+            SignatureCache(max_entries=0)
+
+    def test_ecdsa(self, samples):
+        cache = SignatureCache()
+        public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
+
+        assert public_key.verify(samples["SIGNATURE"], samples["MESSAGE"], signature_cache=cache)
+        assert public_key.verify(samples["SIGNATURE"], samples["MESSAGE"], signature_cache=cache)
+        assert verify_signature(
+            samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_UNCOMPRESSED"], signature_cache=cache
+        )
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        # Failed verifications are not cached
+        assert not public_key.verify(samples["SIGNATURE"], b"", signature_cache=cache)
+        assert not public_key.verify(samples["SIGNATURE"], b"", signature_cache=cache)
+        assert len(cache) == 1
+
+    def test_schnorr(self):
+        cache = SignatureCache()
+        private_key = PrivateKey()
+        message = urandom(32)
+        signature = private_key.sign_schnorr(message)
+
+        assert private_key.public_key_xonly.verify(signature, message, signature_cache=cache)
+        assert private_key.public_key_xonly.verify(memoryview(signature), bytearray(message), signature_cache=cache)
+        assert not private_key.public_key_xonly.verify(signature, urandom(32), signature_cache=cache)
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert len(cache) == 1
+
+
+class TestPublicKeyCache:
+    def test_parse(self, samples):
+        cache = PublicKeyCache(max_entries=1)
+
+        parsed = cache.parse(samples["PUBLIC_KEY_COMPRESSED"])
+        assert cache.parse(samples["PUBLIC_KEY_COMPRESSED"]) is parsed
+        assert PublicKey(parsed) == PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
+
+        cache.parse(samples["PUBLIC_KEY_UNCOMPRESSED"])
+        assert cache.parse(samples["PUBLIC_KEY_COMPRESSED"]) is not parsed
+        assert len(cache) == 1
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_parse_buffer(self, samples):
+        cache = PublicKeyCache()
+
+        parsed = cache.parse(bytearray(samples["PUBLIC_KEY_COMPRESSED"]))
+        assert cache.parse(memoryview(samples["PUBLIC_KEY_COMPRESSED"])) is parsed
+        assert cache.parse(samples["PUBLIC_KEY_COMPRESSED"]) is parsed
+
+    def test_parse_invalid(self):
+        cache = PublicKeyCache()
+
+        with pytest.raises(ValueError, match=r"The public key could not be parsed or is invalid\."):
+            cache.parse(b"\x02" + bytes(32))
+
+        assert len(cache) == 0
+
+    def test_public_key(self, samples):
+        cache = PublicKeyCache()
+        public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"], public_key_cache=cache)
+        public_key.add(b"\x01", update=True)
+
+        assert PublicKey(samples["PUBLIC_KEY_COMPRESSED"], public_key_cache=cache).format() == samples.get(
+            "PUBLIC_KEY_COMPRESSED"
+        )
+        assert cache.hits == 1
+
+    def test_verify_signature(self, samples):
+        cache = PublicKeyCache()
+
+        for _ in range(2):
+            assert verify_signature(
+                samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"], public_key_cache=cache
+            )
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_ecdh(self):
+        cache = PublicKeyCache()
+        a = PrivateKey()
+        b = PrivateKey()
+
+        assert a.ecdh(b.public_key.format(), public_key_cache=cache) == b.ecdh(a.public_key.format())
+        assert a.ecdh(b.public_key.format(), public_key_cache=cache) == b.ecdh(a.public_key.format())
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+
+from coincurve import ContextPool, PrivateKey
+
+
+class TestContextPool:
+    def test_same_context_per_thread(self):
+        pool = ContextPool(2)
+
+        assert pool.get() is pool.get()
+
+    def test_distinct_contexts_across_threads(self):
+        pool = ContextPool(4)
+        barrier = Barrier(4)
+
+        def get_context(_):
+            barrier.wait()
+            return pool.get()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            contexts = list(executor.map(get_context, range(4)))
+
+        assert len({id(context) for context in contexts}) == 4
+
+    def test_rotate(self):
+        pool = ContextPool(2, name="pool")
+        context = pool.get()
+
+        first = pool.rotate()
+        second = pool.rotate()
+
+        assert context not in {first, second}
+        assert pool.get() in {first, second}
+        assert repr(first) == "pool[0]"
+        assert repr(second) == "pool[1]"
+
+    def test_usable(self):
+        pool = ContextPool(1)
+        private_key = PrivateKey(context=pool.get())
+        message = b"message"
+
+        assert private_key.public_key.verify(private_key.sign(message), message)
+
+    def test_default_size(self):
+        assert len(ContextPool()) >= 1
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match=r"The pool must contain at least one context\."):
+            ContextPool(0)
@@ -0,0 +1,48 @@
+import pytest
+
+from coincurve.der import decode_der, decode_der_many, encode_der, encode_der_many
+from coincurve.keys import PrivateKey, PublicKey
+
+
+def test_canonical_layout(samples):
+    assert encode_der(samples["PRIVATE_KEY_BYTES"], samples["PUBLIC_KEY_UNCOMPRESSED"]) == samples["PRIVATE_KEY_DER"]
+    assert decode_der(samples["PRIVATE_KEY_DER"]) == samples["PRIVATE_KEY_BYTES"]
+    assert decode_der(memoryview(samples["PRIVATE_KEY_DER"])) == samples["PRIVATE_KEY_BYTES"]
+
+
+def test_general_layout(samples):
+    # Keys without the embedded public key are handled by the general parser
+    der = encode_der(samples["PRIVATE_KEY_BYTES"])
+
+    assert len(der) < len(samples["PRIVATE_KEY_DER"])
+    assert decode_der(der) == samples["PRIVATE_KEY_BYTES"]
+    assert decode_der(encode_der(b"\x01", samples["PUBLIC_KEY_UNCOMPRESSED"])) == b"\x01"
+
+
+def test_encode_der_many(samples):
+    private_keys = [PrivateKey(samples["PRIVATE_KEY_BYTES"]), PrivateKey()]
+    secrets = b"".join(private_key.secret for private_key in private_keys)
+
+    assert encode_der_many(secrets, PublicKey.from_secrets(secrets, compressed=False)) == [
+        private_key.to_der() for private_key in private_keys
+    ]
+    assert encode_der_many(b"", b"") == []
+
+    with pytest.raises(ValueError, match=r"Private keys must be 32 bytes long each\."):
+        encode_der_many(secrets[:-1], b"")
+
+    with pytest.raises(ValueError, match=r"Public keys must be 65 bytes long each\."):
+        encode_der_many(secrets, samples["PUBLIC_KEY_UNCOMPRESSED"])
+
+
+def test_decode_der_many(samples):
+    ders = [samples["PRIVATE_KEY_DER"], encode_der(b"\x01", samples["PUBLIC_KEY_UNCOMPRESSED"])]
+
+    assert decode_der_many(ders) == samples["PRIVATE_KEY_BYTES"] + bytes(31) + b"\x01"
+    assert decode_der_many([]) == b""
+
+    with pytest.raises(ValueError, match=r"The private key at index 1 is longer than 32 bytes\."):
+        decode_der_many([samples["PRIVATE_KEY_DER"], encode_der(bytes(33))])
+
+    with pytest.raises(ValueError, match=r"Invalid DER: not a valid PKCS#8 structure"):
+        decode_der_many([b"\x00"])
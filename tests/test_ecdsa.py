@@ -1,11 +1,114 @@
 import pytest
 
-from coincurve.ecdsa import cdata_to_der, der_to_cdata
+from coincurve.ecdsa import (
+    cdata_to_der,
+    cdata_to_der_into,
+    der_to_cdata,
+    deserialize_compact,
+    deserialize_recoverable,
+    deserialize_signature,
+    recoverable_convert,
+    serialize_compact,
+    serialize_compact_into,
+    serialize_recoverable_into,
+    serialize_signature,
+    serialize_signature_into,
+    signature_normalize,
+)
+from coincurve.utils import GROUP_ORDER_INT
 
 
 def test_der(samples):
     assert cdata_to_der(der_to_cdata(samples["SIGNATURE"])) == samples["SIGNATURE"]
 
 
+def test_der_into(samples):
+    signature = samples["SIGNATURE"]
+    out = bytearray(len(signature) + 2)
+
+    assert cdata_to_der_into(der_to_cdata(signature), out, 1) == len(signature)
+    assert out == b"\x00" + signature + b"\x00"
+
+    with pytest.raises(ValueError, match=r"The output buffer does not have enough space at the given offset\."):
+        cdata_to_der_into(der_to_cdata(signature), out, 3)
+
+
+def test_recoverable_into(samples):
+    out = bytearray(66)
+
+    assert serialize_recoverable_into(deserialize_recoverable(samples["RECOVERABLE_SIGNATURE"]), out, 1) == 65
+    assert out[1:] == samples["RECOVERABLE_SIGNATURE"]
+
+    with pytest.raises(ValueError, match=r"The output buffer does not have enough space at the given offset\."):
+        serialize_recoverable_into(deserialize_recoverable(samples["RECOVERABLE_SIGNATURE"]), out, 2)
+
+
+def test_compact(samples):
+    compact = serialize_compact(der_to_cdata(samples["SIGNATURE"]))
+
+    assert len(compact) == 64
+    assert cdata_to_der(deserialize_compact(compact)) == samples["SIGNATURE"]
+    assert cdata_to_der(deserialize_compact(bytearray(compact))) == samples["SIGNATURE"]
+
+    with pytest.raises(ValueError, match=r"Compact signature must be 64 bytes long\."):
+        deserialize_compact(compact[:-1])
+
+    # An r value that is not less than the group order
+    with pytest.raises(ValueError, match=r"The compact signature could not be parsed\."):
+        deserialize_compact(b"\xff" * 32 + compact[32:])
+
+
+def test_compact_into(samples):
+    compact = serialize_compact(der_to_cdata(samples["SIGNATURE"]))
+    out = bytearray(66)
+
+    assert serialize_compact_into(der_to_cdata(samples["SIGNATURE"]), out, 1) == 64
+    assert out == b"\x00" + compact + b"\x00"
+
+    with pytest.raises(ValueError, match=r"The output buffer does not have enough space at the given offset\."):
+        serialize_compact_into(der_to_cdata(samples["SIGNATURE"]), out, 3)
+
+
+def test_signature_encoding(samples):
+    raw_sig = der_to_cdata(samples["SIGNATURE"])
+    compact = serialize_compact(raw_sig)
+    out = bytearray(72)
+
+    assert serialize_signature(raw_sig) == samples["SIGNATURE"]
+    assert serialize_signature(raw_sig, "compact") == compact
+    assert serialize_signature_into(raw_sig, out, encoding="compact") == 64
+    assert out[:64] == compact
+    assert serialize_signature(deserialize_signature(compact, "compact")) == samples["SIGNATURE"]
+    assert serialize_signature(deserialize_signature(samples["SIGNATURE"], "der"), "compact") == compact
+
+    with pytest.raises(ValueError, match=r"The compact signature could not be parsed\."):
+        deserialize_signature(samples["SIGNATURE"], "compact")
+
+    with pytest.raises(ValueError, match=r"The DER-encoded signature could not be parsed\."):
+        deserialize_signature(compact, "der")
+
+    with pytest.raises(ValueError, match=r'The signature encoding must be either "der" or "compact"\.'):
+        serialize_signature(raw_sig, "raw")
+
+
+def test_signature_normalize(samples):
+    compact = serialize_compact(der_to_cdata(samples["SIGNATURE"]))
+    high_s = (GROUP_ORDER_INT - int.from_bytes(compact[32:], "big")).to_bytes(32, "big")
+
+    normalized, raw_sig = signature_normalize(deserialize_compact(compact))
+    assert not normalized
+    assert serialize_compact(raw_sig) == compact
+
+    normalized, raw_sig = signature_normalize(deserialize_compact(compact[:32] + high_s))
+    assert normalized
+    assert serialize_compact(raw_sig) == compact
+
+
+def test_recoverable_convert(samples):
+    recoverable = samples["RECOVERABLE_SIGNATURE"]
+
+    assert serialize_compact(recoverable_convert(deserialize_recoverable(recoverable))) == recoverable[:64]
+
+
 if __name__ == "__main__":
     pytest.main(["-s", __file__])
@@ -1,10 +1,20 @@
-from hashlib import sha512
+import mmap
+from hashlib import sha256, sha512
 from os import urandom
+from weakref import WeakValueDictionary
 
 import pytest
 
-from coincurve.ecdsa import deserialize_recoverable, recover
-from coincurve.keys import PrivateKey, PublicKey, PublicKeyXOnly
+from coincurve._libsecp256k1 import ffi  # noqa: PLC2701
+from coincurve.ecdsa import der_to_cdata, deserialize_recoverable, recover, serialize_compact
+from coincurve.keys import (
+    EcdsaSignature,
+    PrivateKey,
+    PublicKey,
+    PublicKeyArray,
+    PublicKeyXOnly,
+    RecoverableSignature,
+)
 from coincurve.utils import GROUP_ORDER_INT, bytes_to_int, int_to_bytes_padded, verify_signature
 
 G = PublicKey(
@@ -25,6 +35,17 @@ class TestPrivateKey:
             PrivateKey(samples["PRIVATE_KEY_BYTES"]).public_key_xonly.format() == samples["PUBLIC_KEY_COMPRESSED"][1:]
         )
 
+    def test_assign_public_keys(self, samples):
+        private_key = PrivateKey()
+        public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
+        public_key_xonly = PublicKeyXOnly(samples["PUBLIC_KEY_COMPRESSED"][1:])
+
+        private_key.public_key = public_key
+        private_key.public_key_xonly = public_key_xonly
+
+        assert private_key.public_key is public_key
+        assert private_key.public_key_xonly is public_key_xonly
+
     def test_signature_correct(self):
         private_key = PrivateKey()
         public_key = private_key.public_key
@@ -42,6 +63,49 @@ class TestPrivateKey:
         with pytest.raises(ValueError, match=r"Message hash must be 32 bytes long\."):
             PrivateKey().sign(samples["MESSAGE"], lambda x: sha512(x).digest())
 
+    def test_sign_many(self, samples):
+        private_key = PrivateKey(samples["PRIVATE_KEY_BYTES"])
+        messages = [samples["MESSAGE"], urandom(200), b""]
+
+        assert private_key.sign_many(messages) == [private_key.sign(message) for message in messages]
+        assert private_key.sign_many([]) == []
+
+        with pytest.raises(ValueError, match=r"Message hash must be 32 bytes long\."):
+            private_key.sign_many([urandom(32), samples["MESSAGE"]], hasher=None)
+
+    def test_sign_compact(self, samples):
+        private_key = PrivateKey(samples["PRIVATE_KEY_BYTES"])
+        compact = serialize_compact(der_to_cdata(samples["SIGNATURE"]))
+        messages = [samples["MESSAGE"], urandom(200)]
+        out = bytearray(65)
+
+        assert private_key.sign(samples["MESSAGE"], encoding="compact") == compact
+        assert private_key.sign_many(messages, encoding="compact") == [
+            private_key.sign(message, encoding="compact") for message in messages
+        ]
+        assert private_key.sign_into(samples["MESSAGE"], out, 1, encoding="compact") == 64
+        assert out[1:] == compact
+
+        with pytest.raises(ValueError, match=r'The signature encoding must be either "der" or "compact"\.'):
+            private_key.sign(samples["MESSAGE"], encoding="raw")
+
+        with pytest.raises(ValueError, match=r'The signature encoding must be either "der" or "compact"\.'):
+            private_key.sign_many(messages, encoding="raw")
+
+    def test_buffer_inputs(self, samples):
+        private_key = PrivateKey(bytearray(samples["PRIVATE_KEY_BYTES"]))
+        msg_hash = memoryview(bytearray(urandom(32)))
+
+        assert isinstance(private_key.secret, bytes)
+        assert private_key.secret == samples["PRIVATE_KEY_BYTES"]
+        assert private_key.sign(msg_hash, hasher=None) == private_key.sign(bytes(msg_hash), hasher=None)
+        assert private_key.sign_many([msg_hash], hasher=None) == [private_key.sign(bytes(msg_hash), hasher=None)]
+        assert private_key.sign_recoverable(msg_hash, hasher=None) == private_key.sign_recoverable(
+            bytes(msg_hash), hasher=None
+        )
+        assert private_key.sign_schnorr(msg_hash, bytearray(32)) == private_key.sign_schnorr(bytes(msg_hash), bytes(32))
+        assert private_key.ecdh(memoryview(G.format())) == private_key.ecdh(G.format())
+
     def test_signature_recoverable(self, samples):
         private_key = PrivateKey(samples["PRIVATE_KEY_BYTES"])
         assert (
@@ -70,6 +134,47 @@ class TestPrivateKey:
         sig = private_key.sign_schnorr(message)
         assert private_key.public_key_xonly.verify(sig, message)
 
+    def test_schnorr_signature_without_verification(self):
+        private_key = PrivateKey()
+        message = urandom(32)
+
+        sig = private_key.sign_schnorr(message, None, verify=False)
+        assert sig == private_key.sign_schnorr(message, None)
+        assert private_key.public_key_xonly.verify(sig, message)
+
+    def test_sign_into(self, samples):
+        private_key = PrivateKey(samples["PRIVATE_KEY_BYTES"])
+        message = urandom(32)
+        out = bytearray(200)
+        view = memoryview(out)
+
+        length = private_key.sign_into(samples["MESSAGE"], out, 4)
+        assert out[4 : 4 + length] == private_key.sign(samples["MESSAGE"])
+
+        assert private_key.sign_recoverable_into(samples["MESSAGE"], view, 100) == 65
+        assert out[100:165] == private_key.sign_recoverable(samples["MESSAGE"])
+
+        assert private_key.sign_schnorr_into(message, view, 136, None) == 64
+        assert out[136:] == private_key.sign_schnorr(message, None)
+
+        with pytest.raises(ValueError, match=r"The output buffer does not have enough space at the given offset\."):
+            private_key.sign_into(samples["MESSAGE"], bytearray(8))
+
+        with pytest.raises(ValueError, match=r"The output buffer does not have enough space at the given offset\."):
+            private_key.sign_schnorr_into(message, out, -1)
+
+        with pytest.raises(BufferError):
+            private_key.sign_schnorr_into(message, bytes(64))
+
+    def test_schnorr_signature_after_update(self):
+        private_key = PrivateKey(b"\x01")
+        message = urandom(32)
+        private_key.sign_schnorr(message)
+        private_key.add(b"\x09", update=True)
+
+        sig = private_key.sign_schnorr(message)
+        assert PrivateKey(b"\x0a").public_key_xonly.verify(sig, message)
+
     def test_to_hex(self, samples):
         assert PrivateKey(samples["PRIVATE_KEY_BYTES"]).to_hex() == samples["PRIVATE_KEY_HEX"]
 
@@ -100,6 +205,50 @@ class TestPrivateKey:
 
         assert a.ecdh(b.public_key.format()) == b.ecdh(a.public_key.format())
 
+    def test_ecdh_custom_hash(self):
+        a = PrivateKey()
+        b = PrivateKey()
+
+        @ffi.callback("secp256k1_ecdh_hash_function")
+        def x_coordinate(output, x32, y32, data):  # noqa: ARG001
+            ffi.memmove(output, x32, 32)
+            return 1
+
+        @ffi.callback("secp256k1_ecdh_hash_function")
+        def failing(output, x32, y32, data):  # noqa: ARG001
+            return 0
+
+        shared_point = b.public_key.multiply(a.secret)
+        assert a.ecdh(b.public_key.format(), custom_hash=(x_coordinate, ffi.NULL)) == shared_point.format()[1:]
+        assert a.ecdh(b.public_key.format(), output_size=64)[:32] == a.ecdh(b.public_key.format())
+
+        with pytest.raises(ValueError, match=r"The hash function failed\."):
+            a.ecdh(b.public_key.format(), custom_hash=(failing, ffi.NULL))
+
+        with pytest.raises(ValueError, match=r"The output size is too small for the default hash function\."):
+            a.ecdh(b.public_key.format(), output_size=16)
+
+    def test_ecdh_many(self):
+        private_key = PrivateKey()
+        peers = [PrivateKey().public_key for _ in range(3)]
+        public_keys = PublicKeyArray.from_public_keys(peers)
+        expected = b"".join(private_key.ecdh(peer.format()) for peer in peers)
+
+        assert private_key.ecdh_many(public_keys) == expected
+        assert private_key.ecdh_many(public_keys.format()) == expected
+        assert private_key.ecdh_many(public_keys.format(compressed=False), key_size=65) == expected
+        assert private_key.ecdh_many(b"") == b""
+
+        @ffi.callback("secp256k1_ecdh_hash_function")
+        def fail_on_g(output, x32, y32, data):  # noqa: ARG001
+            return ffi.buffer(x32, 32)[:] != G.format()[1:]
+
+        with pytest.raises(ValueError, match=r"The hash function failed for the public key at index 1\."):
+            PrivateKey(b"\x01").ecdh_many(peers[0].format() + G.format(), custom_hash=(fail_on_g, ffi.NULL))
+
+        with pytest.raises(ValueError, match=r"The public key at index 0 could not be parsed or is invalid\."):
+            private_key.ecdh_many(b"\x02" + bytes(32))
+
     def test_add(self):
         assert PrivateKey(b"\x01").add(b"\x09").to_int() == 10
 
@@ -110,6 +259,17 @@ class TestPrivateKey:
         assert new_private_key.to_int() == 10
         assert private_key is new_private_key
 
+    def test_add_update_public_keys(self):
+        private_key = PrivateKey(b"\x01")
+        public_key = private_key.public_key
+        private_key.public_key_xonly  # noqa: B018
+        private_key.add(b"\x09", update=True)
+
+        expected = PrivateKey(b"\x0a")
+        assert public_key == expected.public_key
+        assert private_key.public_key == expected.public_key
+        assert private_key.public_key_xonly == expected.public_key_xonly
+
     def test_multiply(self):
         assert PrivateKey(b"\x05").multiply(b"\x05").to_int() == 25
 
@@ -120,11 +280,34 @@ class TestPrivateKey:
         assert new_private_key.to_int() == 25
         assert private_key is new_private_key
 
+    def test_multiply_update_public_keys(self):
+        private_key = PrivateKey(b"\x05")
+        private_key.multiply(b"\x05", update=True)
+
+        expected = PrivateKey(b"\x19")
+        assert private_key.public_key == expected.public_key
+        assert private_key.public_key_xonly == expected.public_key_xonly
+
 
 class TestPublicKey:
     def test_from_secret(self, samples):
         assert PublicKey.from_secret(samples["PRIVATE_KEY_BYTES"]).format() == samples["PUBLIC_KEY_COMPRESSED"]
 
+    def test_from_secrets(self, samples):
+        secrets = samples["PRIVATE_KEY_BYTES"] + int_to_bytes_padded(1)
+
+        assert PublicKey.from_secrets(secrets) == samples["PUBLIC_KEY_COMPRESSED"] + G.format()
+        assert PublicKey.from_secrets(secrets, compressed=False) == samples.get("PUBLIC_KEY_UNCOMPRESSED") + G.format(
+            compressed=False
+        )
+        assert PublicKey.from_secrets(b"") == b""
+
+        with pytest.raises(ValueError, match=r"Secrets must be 32 bytes long each\."):
+            PublicKey.from_secrets(secrets[:-1])
+
+        with pytest.raises(ValueError, match=r"The secret at index 1 is invalid\."):
+            PublicKey.from_secrets(secrets[:32] + bytes(32))
+
     def test_from_point(self, samples):
         assert PublicKey.from_point(samples["PUBLIC_KEY_X"], samples["PUBLIC_KEY_Y"]).format() == samples.get(
             "PUBLIC_KEY_COMPRESSED"
@@ -136,6 +319,30 @@ class TestPublicKey:
             == PublicKey.from_signature_and_message(samples["RECOVERABLE_SIGNATURE"], samples["MESSAGE"]).format()
         )
 
+    def test_recover_batch(self, samples):
+        private_key = PrivateKey()
+        msg_hash = urandom(32)
+        signature = private_key.sign_recoverable(msg_hash, hasher=None)
+        invalid_recid = signature[:64] + b"\x04"
+        signatures = bytearray(samples["RECOVERABLE_SIGNATURE"] + signature + invalid_recid + bytes(65))
+        msg_hashes = sha256(samples["MESSAGE"]).digest() + msg_hash * 3
+
+        public_keys, recovered = PublicKey.recover_batch(signatures, msg_hashes)
+        assert recovered == [True, True, False, False]
+        assert public_keys == samples["PUBLIC_KEY_COMPRESSED"] + private_key.public_key.format() + bytes(66)
+
+        public_keys, recovered = PublicKey.recover_batch(signatures[:65], msg_hashes[:32], compressed=False)
+        assert recovered == [True]
+        assert public_keys == samples["PUBLIC_KEY_UNCOMPRESSED"]
+
+        assert PublicKey.recover_batch(b"", b"") == (b"", [])
+
+        with pytest.raises(ValueError, match=r"Message hashes must be 32 bytes long each\."):
+            PublicKey.recover_batch(signatures, msg_hashes[:-1])
+
+        with pytest.raises(ValueError, match=r"Recoverable signatures must be 65 bytes long each\."):
+            PublicKey.recover_batch(signatures[:-1], msg_hashes)
+
     def test_format(self, samples):
         assert PublicKey(samples["PUBLIC_KEY_UNCOMPRESSED"]).format(compressed=True) == samples.get(
             "PUBLIC_KEY_COMPRESSED"
@@ -144,6 +351,17 @@ class TestPublicKey:
             "PUBLIC_KEY_UNCOMPRESSED"
         )
 
+    def test_format_into(self, samples):
+        public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
+        out = bytearray(100)
+
+        assert public_key.format_into(out, 2) == 33
+        assert public_key.format_into(memoryview(out)[35:], compressed=False) == 65
+        assert out == b"\x00\x00" + samples["PUBLIC_KEY_COMPRESSED"] + samples["PUBLIC_KEY_UNCOMPRESSED"]
+
+        with pytest.raises(ValueError, match=r"The output buffer does not have enough space at the given offset\."):
+            public_key.format_into(out, 68)
+
     def test_point(self, samples):
         assert PublicKey(samples["PUBLIC_KEY_COMPRESSED"]).point() == (
             samples["PUBLIC_KEY_X"],
@@ -154,6 +372,43 @@ class TestPublicKey:
         public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
         assert public_key.verify(samples["SIGNATURE"], samples["MESSAGE"])
 
+    def test_verify_compact(self, samples):
+        public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
+        compact = serialize_compact(der_to_cdata(samples["SIGNATURE"]))
+
+        assert public_key.verify(compact, samples["MESSAGE"], encoding="compact")
+        assert public_key.verify(bytearray(compact), samples["MESSAGE"], encoding="compact")
+        assert not public_key.verify(compact, b"", encoding="compact")
+
+        with pytest.raises(ValueError, match=r"The compact signature could not be parsed\."):
+            public_key.verify(samples["SIGNATURE"], samples["MESSAGE"], encoding="compact")
+
+        with pytest.raises(ValueError, match=r"The compact signature could not be parsed\."):
+            public_key.verify(compact[:-1], samples["MESSAGE"], encoding="compact")
+
+        with pytest.raises(ValueError, match=r'The signature encoding must be either "der" or "compact"\.'):
+            public_key.verify(compact, samples["MESSAGE"], encoding="raw")
+
+    def test_buffer_inputs(self, samples):
+        public_key = PublicKey(bytearray(samples["PUBLIC_KEY_COMPRESSED"]))
+        signature = memoryview(samples["SIGNATURE"])
+        msg_hash = bytearray(sha256(samples["MESSAGE"]).digest())
+
+        assert public_key.format() == samples["PUBLIC_KEY_COMPRESSED"]
+        assert PublicKey.from_valid_secret(memoryview(samples["PRIVATE_KEY_BYTES"])) == public_key
+        assert PublicKey.from_secrets(bytearray(samples["PRIVATE_KEY_BYTES"])) == samples["PUBLIC_KEY_COMPRESSED"]
+        assert (
+            PublicKey.from_signature_and_message(
+                bytearray(samples["RECOVERABLE_SIGNATURE"]), memoryview(samples["MESSAGE"])
+            )
+            == public_key
+        )
+        assert public_key.verify(signature, msg_hash, hasher=None)
+
+        # Only C-contiguous buffers can be passed without copying
+        with pytest.raises(BufferError):
+            PublicKey(memoryview(samples["PUBLIC_KEY_COMPRESSED"] * 2)[::2])
+
     def test_transform(self):
         x = urandom(32)
         k = urandom(32)
@@ -168,6 +423,104 @@ class TestPublicKey:
         assert PublicKey.combine_keys([a, b]) == a.combine([b])
 
 
+class TestPublicKeyArray:
+    def test_parse(self, samples):
+        compressed = PublicKeyArray(samples["PUBLIC_KEY_COMPRESSED"] + G.format())
+        uncompressed = PublicKeyArray(samples["PUBLIC_KEY_UNCOMPRESSED"] + G.format(compressed=False), key_size=65)
+
+        assert len(compressed) == len(uncompressed) == 2
+        assert compressed.format() == uncompressed.format() == samples["PUBLIC_KEY_COMPRESSED"] + G.format()
+        assert compressed.format(compressed=False) == samples["PUBLIC_KEY_UNCOMPRESSED"] + G.format(compressed=False)
+
+    def test_parse_invalid(self, samples):
+        with pytest.raises(ValueError, match=r"The data must consist of public keys that are all either 33 or 65"):
+            PublicKeyArray(samples["PUBLIC_KEY_COMPRESSED"] + b"\x00")
+
+        with pytest.raises(ValueError, match=r"The public key at index 1 could not be parsed or is invalid\."):
+            PublicKeyArray(samples["PUBLIC_KEY_COMPRESSED"] + b"\x02" + bytes(32))
+
+    def test_parse_buffer(self, samples):
+        data = bytearray(samples["PUBLIC_KEY_COMPRESSED"] + G.format())
+        public_keys = PublicKeyArray(memoryview(data))
+        msg_hash = sha256(samples["MESSAGE"]).digest()
+
+        assert public_keys.format() == bytes(data)
+        assert public_keys.index(data[33:]) == 1
+        assert public_keys.verify_batch(
+            [memoryview(samples["SIGNATURE"])] * 2, [bytearray(msg_hash)] * 2, hasher=None
+        ) == [True, False]
+
+    def test_from_public_keys(self):
+        public_keys = [PrivateKey().public_key for _ in range(3)]
+        array = PublicKeyArray.from_public_keys(public_keys)
+
+        assert array.format() == b"".join(pk.format() for pk in public_keys)
+        assert list(array) == public_keys
+        assert array[-1] == public_keys[-1]
+        assert not PublicKeyArray.from_public_keys([]).format()
+
+    def test_getitem_copies(self):
+        array = PublicKeyArray(G.format())
+        array[0].add(b"\x01", update=True)
+
+        assert array[0] == G
+
+        with pytest.raises(IndexError):
+            array[1]
+
+        with pytest.raises(TypeError, match=r"Public key array indices must be integers, not slice\."):
+            array[:1]
+
+    def test_format_into(self, samples):
+        public_keys = PublicKeyArray(samples["PUBLIC_KEY_COMPRESSED"] + G.format())
+        out = bytearray(1 + 65 * 2)
+
+        assert public_keys.format_into(out, 1, compressed=False) == 130
+        assert out[1:] == public_keys.format(compressed=False)
+        assert PublicKeyArray(b"").format_into(bytearray()) == 0
+
+        with pytest.raises(ValueError, match=r"The output buffer does not have enough space at the given offset\."):
+            public_keys.format_into(out, 66)
+
+    def test_lookup(self, samples):
+        array = PublicKeyArray(G.format() + samples["PUBLIC_KEY_COMPRESSED"] + G.format())
+
+        assert array.index(G) == 0
+        assert array.index(samples["PUBLIC_KEY_UNCOMPRESSED"]) == 1
+        assert samples["PUBLIC_KEY_COMPRESSED"] in array
+        assert PrivateKey().public_key not in array
+
+        with pytest.raises(ValueError, match=r"The public key is not in the array\."):
+            array.index(PrivateKey().public_key)
+
+    def test_lookup_many(self):
+        public_keys = [PrivateKey().public_key for _ in range(50)]
+        array = PublicKeyArray.from_public_keys(public_keys + public_keys[:10])
+
+        assert [array.index(public_key) for public_key in public_keys] == list(range(50))
+        assert PrivateKey().public_key not in PublicKeyArray(b"")
+
+    def test_verify_batch(self, samples):
+        array = PublicKeyArray(samples["PUBLIC_KEY_COMPRESSED"] + G.format() + samples["PUBLIC_KEY_COMPRESSED"])
+
+        assert array.verify_batch([samples["SIGNATURE"]] * 3, [samples["MESSAGE"]] * 3) == [True, False, True]
+
+        compact = serialize_compact(der_to_cdata(samples["SIGNATURE"]))
+        assert array.verify_batch(
+            [compact, compact, samples["SIGNATURE"]], [samples["MESSAGE"]] * 3, encoding="compact"
+        ) == [True, False, False]
+
+        with pytest.raises(ValueError, match=r"The number of signatures, messages, and public keys must be equal\."):
+            array.verify_batch([samples["SIGNATURE"]], [samples["MESSAGE"]])
+
+    def test_combine_keys(self):
+        public_keys = [PrivateKey().public_key for _ in range(3)]
+
+        assert PublicKey.combine_keys(PublicKeyArray.from_public_keys(public_keys)) == PublicKey.combine_keys(
+            public_keys
+        )
+
+
 class TestXonlyPubKey:
     def test_parse_invalid(self, samples):
         # Must be 32 bytes
@@ -178,6 +531,64 @@ class TestXonlyPubKey:
         with pytest.raises(ValueError, match=r"The public key could not be parsed or is invalid\."):
             PublicKeyXOnly(samples["X_ONLY_PUBKEY_INVALID"])
 
+    def test_short_buffers(self, samples, tmp_path):
+        path = tmp_path / "keys.bin"
+        path.write_bytes(samples["PRIVATE_KEY_BYTES"] + samples["PUBLIC_KEY_COMPRESSED"])
+
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            view = memoryview(data)
+            # Fixed-width inputs are read in full by libsecp256k1, so shorter buffers must be rejected
+            # rather than reading the memory that follows them
+            for short in (bytearray(b"\x02" * 5), memoryview(b"\x02" * 64)[:31], view[33:34], b"\x02"):
+                with pytest.raises(ValueError, match=r"The public key must be 32 bytes long\."):
+                    PublicKeyXOnly(short)
+
+                with pytest.raises(ValueError, match=r"Secret must be 32 bytes long\."):
+                    PublicKeyXOnly.from_valid_secret(short)
+
+                with pytest.raises(ValueError, match=r"Secret must be 32 bytes long\."):
+                    PublicKey.from_valid_secret(short)
+
+            assert PublicKeyXOnly(view[33:65]).format() == samples["PUBLIC_KEY_COMPRESSED"][1:]
+            assert PublicKey.from_valid_secret(view[:32]).format() == samples["PUBLIC_KEY_COMPRESSED"]
+            assert PublicKeyXOnly.from_valid_secret(view[:32]).format() == samples["PUBLIC_KEY_COMPRESSED"][1:]
+            view.release()
+
+    def test_from_secrets(self):
+        private_keys = [PrivateKey() for _ in range(3)]
+        secrets = b"".join(pk.secret for pk in private_keys)
+
+        assert PublicKeyXOnly.from_secrets(secrets) == b"".join(pk.public_key_xonly.format() for pk in private_keys)
+
+        with pytest.raises(ValueError, match=r"Secrets must be 32 bytes long each\."):
+            PublicKeyXOnly.from_secrets(bytes(33))
+
+        with pytest.raises(ValueError, match=r"The secret at index 0 is invalid\."):
+            PublicKeyXOnly.from_secrets(bytes(32))
+
+    def test_buffer_inputs(self):
+        private_key = PrivateKey()
+        message = urandom(32)
+        signature = private_key.sign_schnorr(message)
+        public_key = PublicKeyXOnly(bytearray(private_key.public_key_xonly.format()))
+
+        assert public_key == private_key.public_key_xonly
+        assert PublicKeyXOnly.from_valid_secret(memoryview(private_key.secret)) == public_key
+        assert PublicKeyXOnly.from_secrets(bytearray(private_key.secret)) == public_key.format()
+        assert public_key.verify(memoryview(signature), bytearray(message))
+        assert PublicKeyXOnly.verify_batch(
+            memoryview(signature), [memoryview(message)], bytearray(public_key.format())
+        ) == [True]
+
+    def test_format_into(self, samples):
+        out = bytearray(33)
+
+        assert PublicKeyXOnly(samples["X_ONLY_PUBKEY"]).format_into(out, 1) == 32
+        assert out[1:] == samples["X_ONLY_PUBKEY"]
+
+        with pytest.raises(ValueError, match=r"The output buffer does not have enough space at the given offset\."):
+            PublicKeyXOnly(samples["X_ONLY_PUBKEY"]).format_into(out, 2)
+
     def test_roundtrip(self, samples):
         assert PublicKeyXOnly(samples["X_ONLY_PUBKEY"]).format() == samples["X_ONLY_PUBKEY"]
         assert PublicKeyXOnly(samples["PUBLIC_KEY_COMPRESSED"][1:]).format() == samples["PUBLIC_KEY_COMPRESSED"][1:]
@@ -205,6 +616,105 @@ class TestXonlyPubKey:
         assert pubkey.format() == bytes.fromhex("e4d810fd50586274face62b8a807eb9719cef49c04177cc6b76a9a4251d5450e")
         assert not pubkey.parity
 
+    def test_verify_batch(self, samples):
+        private_keys = [PrivateKey() for _ in range(3)]
+        messages = [urandom(32) for _ in range(3)]
+        signatures = [pk.sign_schnorr(m) for pk, m in zip(private_keys, messages, strict=True)]
+        public_keys = [pk.public_key_xonly.format() for pk in private_keys]
+
+        assert PublicKeyXOnly.verify_batch(b"".join(signatures), messages, b"".join(public_keys)) == [True] * 3
+
+        # Wrong message, swapped signature, and unparsable public key
+        messages[0] = urandom(32)
+        signatures[1], signatures[2] = signatures[2], signatures[1]
+        public_keys[2] = samples["X_ONLY_PUBKEY_INVALID"]
+        assert PublicKeyXOnly.verify_batch(b"".join(signatures), messages, b"".join(public_keys)) == [False] * 3
+
+        assert PublicKeyXOnly.verify_batch(b"", [], b"") == []
+
+    def test_verify_batch_invalid_lengths(self):
+        with pytest.raises(ValueError, match=r"Signatures must be 64 bytes long each\."):
+            PublicKeyXOnly.verify_batch(bytes(63), [bytes(32)], bytes(32))
+
+        with pytest.raises(ValueError, match=r"Public keys must be 32 bytes long each\."):
+            PublicKeyXOnly.verify_batch(bytes(64), [bytes(32)], bytes(33))
+
+
+class TestEcdsaSignature:
+    def test_encodings(self, samples):
+        signature = EcdsaSignature(samples["SIGNATURE"])
+        compact = signature.to_compact()
+
+        assert signature.to_der() == samples["SIGNATURE"]
+        assert len(compact) == 64
+        assert EcdsaSignature.from_der(memoryview(samples["SIGNATURE"])) == signature
+        assert EcdsaSignature.from_compact(compact) == signature
+        assert EcdsaSignature(compact, "compact").to_der() == samples["SIGNATURE"]
+        assert len({signature, EcdsaSignature.from_compact(compact)}) == 1
+
+        with pytest.raises(ValueError, match=r"The DER-encoded signature could not be parsed\."):
+            EcdsaSignature(compact)
+
+        with pytest.raises(ValueError, match=r"The compact signature could not be parsed\."):
+            EcdsaSignature.from_compact(samples["SIGNATURE"])
+
+    def test_normalize(self, samples):
+        signature = EcdsaSignature(samples["SIGNATURE"])
+        compact = signature.to_compact()
+        high_s = EcdsaSignature.from_compact(
+            compact[:32] + (GROUP_ORDER_INT - bytes_to_int(compact[32:])).to_bytes(32, "big")
+        )
+
+        assert signature.is_normalized
+        assert signature.normalize() is signature
+        assert not high_s.is_normalized
+        assert high_s.normalize() == signature
+
+        public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
+        assert not public_key.verify(high_s, samples["MESSAGE"])
+        assert public_key.verify(high_s.normalize(), samples["MESSAGE"])
+
+    def test_verify(self, samples):
+        signature = EcdsaSignature(samples["SIGNATURE"])
+        public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
+
+        assert public_key.verify(signature, samples["MESSAGE"])
+        assert not G.verify(signature, samples["MESSAGE"])
+
+
+class TestRecoverableSignature:
+    def test_roundtrip(self, samples):
+        signature = RecoverableSignature(samples["RECOVERABLE_SIGNATURE"])
+
+        assert signature.to_bytes() == samples["RECOVERABLE_SIGNATURE"]
+        assert signature.recid == samples["RECOVERABLE_SIGNATURE"][64]
+        assert RecoverableSignature.from_bytes(bytearray(samples["RECOVERABLE_SIGNATURE"])) == signature
+        assert signature.to_ecdsa().to_compact() == samples["RECOVERABLE_SIGNATURE"][:64]
+
+        with pytest.raises(ValueError, match=r"Serialized signature must be 65 bytes long\."):
+            RecoverableSignature(samples["RECOVERABLE_SIGNATURE"][:64])
+
+    def test_recover(self, samples):
+        signature = RecoverableSignature(samples["RECOVERABLE_SIGNATURE"])
+        public_key = PublicKey(samples["PUBLIC_KEY_COMPRESSED"])
+
+        assert signature.recover(samples["MESSAGE"]) == public_key
+        assert PublicKey.from_signature_and_message(signature, samples["MESSAGE"]) == public_key
+        assert public_key.verify(signature.to_ecdsa(), samples["MESSAGE"])
+
+
+@pytest.mark.parametrize(
+    "key",
+    [PrivateKey(), PrivateKey().public_key, PrivateKey().public_key_xonly],
+    ids=["PrivateKey", "PublicKey", "PublicKeyXOnly"],
+)
+def test_slots(key):
+    assert not hasattr(key, "__dict__")
+
+    # Instances can still be weakly referenced, e.g. as values of a `WeakValueDictionary`
+    cache = WeakValueDictionary({"key": key})
+    assert cache["key"] is key
+
 
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -0,0 +1,75 @@
+from os import urandom
+
+import pytest
+
+from coincurve.keys import PrivateKey
+from coincurve.parallel import VerificationPool
+from coincurve.utils import sha256
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with VerificationPool(max_workers=2, chunk_size=3) as pool:
+        yield pool
+
+
+class TestVerificationPool:
+    def test_verify_ecdsa(self, pool):
+        private_keys = [PrivateKey() for _ in range(8)]
+        msg_hashes = [sha256(urandom(64)) for _ in range(8)]
+        signatures = [pk.sign(msg_hash, hasher=None) for pk, msg_hash in zip(private_keys, msg_hashes, strict=True)]
+        public_keys = [pk.public_key.format(compressed=i % 2 == 0) for i, pk in enumerate(private_keys)]
+
+        assert pool.verify_ecdsa(signatures, msg_hashes, public_keys) == [True] * 8
+
+        # Wrong message, unparsable signature, and unparsable public key
+        msg_hashes[1] = sha256(b"")
+        signatures[4] = b"\x00"
+        public_keys[7] = b"\x02" + bytes(32)
+        assert pool.verify_ecdsa(signatures, msg_hashes, public_keys) == [
+            True,
+            False,
+            True,
+            True,
+            False,
+            True,
+            True,
+            False,
+        ]
+
+    def test_verify_ecdsa_invalid(self, pool, samples):
+        with pytest.raises(
+            ValueError, match=r"The number of signatures, message hashes, and public keys must be equal"
+        ):
+            pool.verify_ecdsa([samples["SIGNATURE"]], [], [samples["PUBLIC_KEY_COMPRESSED"]])
+
+        with pytest.raises(ValueError, match=r"Message hash must be 32 bytes long\."):
+            pool.verify_ecdsa([samples["SIGNATURE"]], [samples["MESSAGE"]], [samples["PUBLIC_KEY_COMPRESSED"]])
+
+    def test_verify_schnorr(self, pool, samples):
+        private_keys = [PrivateKey() for _ in range(7)]
+        messages = [urandom(32) for _ in range(6)] + [b"variable length message"]
+        signatures = [pk.sign_schnorr(sha256(m)) for pk, m in zip(private_keys, messages, strict=True)]
+        public_keys = [pk.public_key_xonly.format() for pk in private_keys]
+
+        expected = [True] * 6 + [False]
+        assert pool.verify_schnorr(b"".join(signatures), messages, b"".join(public_keys)) == [False] * 7
+
+        messages = [sha256(m) for m in messages]
+        public_keys[6] = samples["X_ONLY_PUBKEY_INVALID"]
+        assert pool.verify_schnorr(b"".join(signatures), messages, b"".join(public_keys)) == expected
+
+    def test_verify_schnorr_invalid(self, pool):
+        with pytest.raises(ValueError, match=r"Signatures must be 64 bytes long each\."):
+            pool.verify_schnorr(bytes(63), [bytes(32)], bytes(32))
+
+        with pytest.raises(ValueError, match=r"Public keys must be 32 bytes long each\."):
+            pool.verify_schnorr(bytes(64), [bytes(32)], bytes(33))
+
+    def test_empty(self, pool):
+        assert pool.verify_ecdsa([], [], []) == []
+        assert pool.verify_schnorr(b"", [], b"") == []
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError, match=r"The chunk size must be at least 1\."):
+            VerificationPool(chunk_size=0)
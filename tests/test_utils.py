@@ -2,6 +2,8 @@ from os import urandom
 
 import pytest
 
+from coincurve.ecdsa import der_to_cdata, serialize_compact
+from coincurve.keys import PrivateKey
 from coincurve.utils import (
     GROUP_ORDER,
     GROUP_ORDER_INT,
@@ -9,12 +11,14 @@ from coincurve.utils import (
     bytes_to_int,
     chunk_data,
     der_to_pem,
+    generate_keys,
     get_valid_secret,
     int_to_bytes,
     int_to_bytes_padded,
     pad_scalar,
     pem_to_der,
     validate_secret,
+    verify_batch,
     verify_signature,
 )
 
@@ -37,6 +41,28 @@ def test_get_valid_secret():
     assert ZERO < secret < GROUP_ORDER
 
 
+class TestGenerateKeys:
+    def test_compressed(self):
+        secrets, public_keys = generate_keys(5)
+
+        assert len(secrets) == 5 * 32
+        assert len(public_keys) == 5 * 33
+        assert len({secrets[i : i + 32] for i in range(0, len(secrets), 32)}) == 5
+        for i in range(5):
+            secret = secrets[i * 32 : (i + 1) * 32]
+            assert ZERO < secret < GROUP_ORDER
+            assert PrivateKey(secret).public_key.format() == public_keys[i * 33 : (i + 1) * 33]
+
+    def test_uncompressed(self):
+        secrets, public_keys = generate_keys(2, compressed=False)
+
+        assert len(public_keys) == 2 * 65
+        assert PrivateKey(secrets[32:]).public_key.format(compressed=False) == public_keys[65:]
+
+    def test_empty(self):
+        assert generate_keys(0) == (b"", b"")
+
+
 class TestValidateSecret:
     def test_valid(self):
         secret = validate_secret(b"\x01")
@@ -78,6 +104,70 @@ def test_der_conversion(samples):
 def test_verify_signature(samples):
     assert verify_signature(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"])
     assert verify_signature(samples["SIGNATURE"], samples["MESSAGE"], samples["PUBLIC_KEY_UNCOMPRESSED"])
+    assert verify_signature(
+        memoryview(samples["SIGNATURE"]), bytearray(samples["MESSAGE"]), bytearray(samples["PUBLIC_KEY_COMPRESSED"])
+    )
+
+
+def test_verify_signature_compact(samples):
+    compact = serialize_compact(der_to_cdata(samples["SIGNATURE"]))
+
+    assert verify_signature(compact, samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"], encoding="compact")
+
+    with pytest.raises(ValueError, match=r"The compact signature could not be parsed\."):
+        verify_signature(compact[:-1], samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"], encoding="compact")
+
+    with pytest.raises(ValueError, match=r'The signature encoding must be either "der" or "compact"\.'):
+        verify_signature(compact, samples["MESSAGE"], samples["PUBLIC_KEY_COMPRESSED"], encoding="raw")
+
+
+class TestVerifyBatch:
+    def test_correct(self, samples):
+        assert verify_batch(
+            [samples["SIGNATURE"], samples["SIGNATURE"]],
+            [samples["MESSAGE"], samples["MESSAGE"]],
+            [samples["PUBLIC_KEY_COMPRESSED"], samples["PUBLIC_KEY_UNCOMPRESSED"]],
+        ) == [True, True]
+
+    def test_invalid_entries(self, samples):
+        assert verify_batch(
+            [samples["SIGNATURE"], samples["SIGNATURE"], b"\x00", samples["SIGNATURE"]],
+            [samples["MESSAGE"], samples["MESSAGE"] + b"\x01", samples["MESSAGE"], samples["MESSAGE"]],
+            [
+                samples["PUBLIC_KEY_COMPRESSED"],
+                samples["PUBLIC_KEY_COMPRESSED"],
+                samples["PUBLIC_KEY_COMPRESSED"],
+                b"\x02" + bytes(32),
+            ],
+        ) == [True, False, False, False]
+
+    def test_empty(self):
+        assert verify_batch([], [], []) == []
+
+    def test_buffers(self, samples):
+        assert verify_batch(
+            [bytearray(samples["SIGNATURE"])],
+            [memoryview(samples["MESSAGE"])],
+            [memoryview(bytearray(samples["PUBLIC_KEY_COMPRESSED"]))],
+        ) == [True]
+
+    def test_compact(self, samples):
+        compact = serialize_compact(der_to_cdata(samples["SIGNATURE"]))
+
+        assert verify_batch(
+            [compact, compact[:-1], samples["SIGNATURE"]],
+            [samples["MESSAGE"]] * 3,
+            [samples["PUBLIC_KEY_COMPRESSED"]] * 3,
+            encoding="compact",
+        ) == [True, False, False]
+
+    def test_length_mismatch(self, samples):
+        with pytest.raises(ValueError, match=r"The number of signatures, messages, and public keys must be equal\."):
+            verify_batch([samples["SIGNATURE"]], [], [samples["PUBLIC_KEY_COMPRESSED"]])
+
+    def test_invalid_message_hash(self, samples):
+        with pytest.raises(ValueError, match=r"Message hash must be 32 bytes long\."):
+            verify_batch([samples["SIGNATURE"]], [samples["MESSAGE"]], [samples["PUBLIC_KEY_COMPRESSED"]], hasher=None)
 
 
 def test_chunk_data():